@@ -0,0 +1 @@
+"""Offline benchmarks of tritius scraping and parsing."""
@@ -0,0 +1,232 @@
+"""Run benchmarks of scraping and parsing hot paths.
+
+Usage: scripts/benchmark [--iterations N] [--save FILE] [--baseline FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+
+import aiohttp
+from tritius.api import (
+    TritiusApiClient,
+    _extract_borrowings_page,
+    _get_form_inputs,
+)
+from tritius.const import Selector
+from tritius.host import TritiusHost, register_host
+from tritius.parser import PARSE_EXECUTOR, parse_html, parser_backend
+
+from . import pages
+from .server import StandInServer
+
+# Allowed slowdown against baseline before benchmark is reported as regression.
+TOLERANCE = 0.2
+
+# Import of integration and its platforms in fresh interpreter, modules of Home
+# Assistant are imported before, as they are loaded when integration is.
+_IMPORT = """
+import sys, time, tracemalloc
+import homeassistant.helpers.aiohttp_client, homeassistant.helpers.storage
+import homeassistant.helpers.update_coordinator, homeassistant.components.sensor
+if sys.argv[1] == "memory":
+    tracemalloc.start()
+wall, cpu = time.perf_counter(), time.thread_time()
+import tritius, tritius.binary_sensor, tritius.button, tritius.sensor, tritius.switch
+print(time.perf_counter() - wall, time.thread_time() - cpu, tracemalloc.get_traced_memory()[1])
+"""
+
+type Benchmark = Callable[[], Awaitable[object]]
+
+
+@dataclass
+class Result:
+    """Measured values of one benchmark, times are per iteration."""
+
+    name: str
+    wall_ms: float
+    cpu_ms: float
+    peak_kib: float
+
+
+@asynccontextmanager
+async def _client(url: str) -> AsyncIterator[TritiusApiClient]:
+    """Client without page cache and rate limits."""
+    register_host(TritiusHost(url, rate=1e9, burst=10**9))
+    async with aiohttp.ClientSession(
+        cookie_jar=aiohttp.CookieJar(unsafe=True)
+    ) as session:
+        yield TritiusApiClient(
+            url=url,
+            username="reader",
+            password="secret",
+            session=session,
+            page_cache_ttl=0,
+        )
+
+
+async def _measure(name: str, benchmark: Benchmark, iterations: int) -> Result:
+    """Measure benchmark, memory is measured separately to not skew times."""
+    await benchmark()
+    walls: list[float] = []
+    cpus: list[float] = []
+    for _ in range(iterations):
+        wall, cpu = time.perf_counter(), time.thread_time()
+        await benchmark()
+        walls.append(time.perf_counter() - wall)
+        cpus.append(time.thread_time() - cpu)
+
+    tracemalloc.start()
+    await benchmark()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return Result(
+        name,
+        statistics.median(walls) * 1000,
+        statistics.median(cpus) * 1000,
+        peak / 1024,
+    )
+
+
+async def _async_account(
+    account: str, borrowings: int, iterations: int
+) -> list[Result]:
+    """Run benchmarks against stand-in server of one account."""
+    results: list[Result] = []
+    with StandInServer(borrowings) as server:
+        async with _client(server.url) as client:
+            await client.async_get_user_data()
+            results.extend(
+                [
+                    await _measure(
+                        f"async_get_borrowings[{account}]",
+                        client.async_get_borrowings,
+                        iterations,
+                    ),
+                    await _measure(
+                        f"async_get_user_data[{account}]",
+                        client.async_get_user_data,
+                        iterations,
+                    ),
+                ]
+            )
+
+        async def login() -> None:
+            async with _client(server.url) as client:
+                await client.async_get_user_data()
+
+        results.append(await _measure(f"login[{account}]", login, iterations))
+    return results
+
+
+async def _async_import_once(mode: str) -> list[float]:
+    """Import integration in fresh interpreter, return wall, cpu and peak."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", _IMPORT, mode, stdout=asyncio.subprocess.PIPE
+    )
+    stdout, _ = await process.communicate()
+    return [float(value) for value in stdout.split()]
+
+
+async def _async_import(iterations: int) -> Result:
+    """Benchmark import of integration, parser stack should not be imported."""
+    measured = [await _async_import_once("time") for _ in range(iterations)]
+    peak = (await _async_import_once("memory"))[2]
+    return Result(
+        "import[tritius]",
+        statistics.median(wall for wall, _, _ in measured) * 1000,
+        statistics.median(cpu for _, cpu, _ in measured) * 1000,
+        peak / 1024,
+    )
+
+
+async def _async_form_inputs(iterations: int) -> Result:
+    """Benchmark form inputs extraction of personal data."""
+    form = parse_html(pages.personal_data_page()).select_one(
+        Selector.PORTLET_PERSONAL_DATA
+    )
+
+    async def form_inputs() -> None:
+        _get_form_inputs(form)
+
+    return await _measure("_get_form_inputs", form_inputs, iterations)
+
+
+async def _async_extract_borrowings(
+    account: str, borrowings: int, iterations: int
+) -> Result:
+    """Benchmark parsing of changed borrowings page without network."""
+    text = pages.borrowings_page(borrowings)
+
+    async def extract() -> None:
+        _extract_borrowings_page(parse_html(text, (Selector.PORTLET_BORROWINGS,)))
+
+    return await _measure(f"_extract_borrowings_page[{account}]", extract, iterations)
+
+
+async def _async_run(iterations: int) -> list[Result]:
+    """Run all benchmarks."""
+    results = [await _async_import(iterations), await _async_form_inputs(iterations)]
+    for account, borrowings in pages.ACCOUNTS.items():
+        results.append(await _async_extract_borrowings(account, borrowings, iterations))
+        results.extend(await _async_account(account, borrowings, iterations))
+    return results
+
+
+def _regressions(results: list[Result], baseline: dict[str, dict]) -> list[str]:
+    """Benchmarks slower than baseline."""
+    return [
+        f"{result.name}: {result.wall_ms:.2f}ms, baseline {previous['wall_ms']:.2f}ms"
+        for result in results
+        if (previous := baseline.get(result.name)) is not None
+        and result.wall_ms > previous["wall_ms"] * (1 + TOLERANCE)
+    ]
+
+
+def main() -> int:
+    """Run benchmarks and report results."""
+    parser = argparse.ArgumentParser(prog="benchmark", description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--save", help="store results as json")
+    parser.add_argument("--baseline", help="compare with results stored as json")
+    args = parser.parse_args()
+
+    # parse in benchmark thread, its cpu time would miss work of parse threads
+    PARSE_EXECUTOR.set_workers(0)
+    results = asyncio.run(_async_run(args.iterations))
+
+    sys.stdout.write(f"parser backend: {parser_backend()}\n")
+    sys.stdout.write(
+        f"{'benchmark':<36}{'wall ms':>10}{'cpu ms':>10}{'peak KiB':>10}\n"
+    )
+    for result in results:
+        sys.stdout.write(
+            f"{result.name:<36}{result.wall_ms:>10.2f}"
+            f"{result.cpu_ms:>10.2f}{result.peak_kib:>10.1f}\n"
+        )
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump({result.name: asdict(result) for result in results}, file)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = _regressions(results, json.load(file))
+        for regression in regressions:
+            sys.stdout.write(f"REGRESSION {regression}\n")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""Fixture pages with structure of tritius library pages."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import date, timedelta
+
+# Number of borrowings in fixture accounts.
+ACCOUNTS: dict[str, int] = {
+    "small": 2,
+    "typical": 12,
+    "large": 250,
+}
+
+_HEAD = """<!DOCTYPE html>
+<html lang="cs">
+<head>
+<meta charset="utf-8">
+<title>Tritius</title>
+<link rel="stylesheet" href="/static/css/bootstrap.min.css">
+<link rel="stylesheet" href="/static/css/tritius.css">
+<script src="/static/js/jquery.min.js"></script>
+<script src="/static/js/bootstrap.min.js"></script>
+</head>
+<body>
+"""
+
+_FOOTER = (
+    """<footer class="footer"><div class="container"><ul class="list-inline">"""
+    + "".join(
+        f"""<li><a href="/info/{i}" title="Informace {i}">Informace {i}</a></li>"""
+        for i in range(40)
+    )
+    + """</ul></div></footer>
+<script>window.tritius = {"locale": "cs", "analytics": false};</script>
+</body>
+</html>
+"""
+)
+
+_MENU = "".join(
+    f"""<li class="menu-item"><a href="/menu/{i}"><i class="fa fa-book"></i>
+<span>Položka {i}</span></a></li>"""
+    for i in range(30)
+)
+
+
+def navbar(expiration: date) -> str:
+    """Navbar with registration expiration."""
+    return f"""<nav id="navbar" class="navbar navbar-default"><ul class="nav navbar-nav">
+{_MENU}
+<li class="dropdown dropdown-user"><a href="#" class="dropdown-toggle">Účet</a>
+<ul class="dropdown-menu"><li class="hidden-xs"><span class="dropdown-text">
+{expiration:%d.%m.%Y}
+</span></li><li><a href="/logout">Odhlásit</a></li></ul></li>
+</ul></nav>
+"""
+
+
+def _page(content: str, expiration: date) -> str:
+    """Whole page with content."""
+    return (
+        _HEAD
+        + navbar(expiration)
+        + f"""<div class="container"><div class="row">{content}</div></div>"""
+        + _FOOTER
+    )
+
+
+def login_page() -> str:
+    """Page with login form."""
+    return _page(
+        f"""{_flash(None)}
+<form class="login-form" action="/process-login" method="post">
+<input type="hidden" name="_csrf" value="c0ffee">
+<input type="hidden" name="targetUrl" value="/">
+<input type="text" name="username" value="">
+<input type="password" name="password" value="">
+<button type="submit">Přihlásit</button>
+</form>""",
+        date.today(),
+    )
+
+
+def _borrowing_row(index: int, today: date, extension: int) -> str:
+    """Row of borrowings table."""
+    expiration = today + timedelta(days=1 + index % 40 + extension)
+    return f"""<tr>
+<td>{index + 1}</td>
+<td>{today - timedelta(days=30):%d.%m.%Y}</td>
+<td>
+{expiration:%d.%m.%Y}
+</td>
+<td>{index % 3}</td>
+<td><a href="/detail/{1000 + index}">Kniha číslo {index}</a></td>
+<td>
+Autor {index % 17}
+</td>
+<td>Pobočka</td>
+<td><form action="/profile/renew" method="post">
+<input type="hidden" name="_csrf" value="c0ffee">
+<input type="hidden" name="id" value="{1000 + index}">
+<button type="submit">Prodloužit</button></form></td>
+</tr>
+"""
+
+
+def _flash(alert: str | None) -> str:
+    """Flash messages with optional error alert."""
+    if alert is None:
+        return """<div class="flash-messages"></div>"""
+    return f"""<div class="flash-messages"><div class="alert alert-danger">
+<span>{alert}</span></div></div>"""
+
+
+def _pagination(pages: int) -> str:
+    """Links to pages of borrowings."""
+    if pages < 2:
+        return ""
+    links = "".join(
+        f"""<li><a href="/profile/borrowings/current?page={page}">{page}</a></li>"""
+        for page in range(1, pages + 1)
+    )
+    return f"""<ul class="pagination">{links}</ul>"""
+
+
+def borrowings_page(
+    count: int,
+    extension: int = 0,
+    alert: str | None = None,
+    page: int = 1,
+    page_size: int = 0,
+    extensions: Mapping[int, int] | None = None,
+) -> str:
+    """Page with current borrowings, renewed ones extended by days.
+
+    Single borrowings are extended by days of extensions under their ids,
+    borrowings are split to pages of page size when it is given.
+    """
+    extensions = extensions or {}
+    today = date.today()
+    indexes = range(count)
+    pages = 1
+    if page_size > 0:
+        pages = max(1, -(-count // page_size))
+        indexes = indexes[(page - 1) * page_size : page * page_size]
+    rows = "".join(
+        _borrowing_row(index, today, extension + extensions.get(1000 + index, 0))
+        for index in indexes
+    )
+    return _page(
+        f"""{_flash(alert)}
+<div id="borrowings-portlet" class="portlet"><div class="portlet-content">
+<table class="table"><thead><tr><th>#</th><th>Od</th><th>Do</th><th>Prodl.</th>
+<th>Název</th><th>Autor</th><th>Pobočka</th><th></th></tr></thead>
+<tbody>{rows}</tbody></table>
+{_pagination(pages)}
+<form action="/profile/renew-all" method="post">
+<input type="hidden" name="_csrf" value="c0ffee">
+<button type="submit">Prodloužit vše</button></form>
+</div></div>""",
+        today + timedelta(days=365),
+    )
+
+
+def personal_data_page(
+    reader_number: str = "31500000123",
+    firstname: str = "Jana",
+    lastname: str = "Nováková",
+) -> str:
+    """Page with personal data."""
+    fields = {
+        "readerNumber": reader_number,
+        "firstname": firstname,
+        "lastname": lastname,
+        "email": "jana@example.com",
+        "street": "Hlavní 1",
+        "city": "Praha",
+        "zip": "11000",
+        "phone": "+420123456789",
+    }
+    inputs = "".join(
+        f"""<div class="form-group"><label>{name}</label>
+<input class="form-control" name="values[{name}]" value="{value}"></div>"""
+        for name, value in fields.items()
+    )
+    return _page(
+        f"""<div id="portlet-personal-data" class="portlet">
+<form action="/profile/personal-data" method="post">{inputs}</form></div>""",
+        date.today() + timedelta(days=365),
+    )
@@ -0,0 +1,87 @@
+"""Local stand-in of tritius library server."""
+
+from __future__ import annotations
+
+import asyncio
+import secrets
+import threading
+from typing import Self
+
+from aiohttp import web
+
+from . import pages
+
+SESSION_COOKIE = "JSESSIONID"
+
+
+class StandInServer:
+    """Serve fixture pages of one account in background thread."""
+
+    def __init__(self, borrowings: int) -> None:
+        """Initialize."""
+        self._pages = {
+            "borrowings": pages.borrowings_page(borrowings),
+            "personal_data": pages.personal_data_page(),
+            "login": pages.login_page(),
+        }
+        self._sessions: set[str] = set()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    def _page(self, request: web.Request, name: str) -> web.Response:
+        """Return page or login page when not logged in."""
+        if request.cookies.get(SESSION_COOKIE) not in self._sessions:
+            name = "login"
+        return web.Response(text=self._pages[name], content_type="text/html")
+
+    async def _root(self, request: web.Request) -> web.Response:
+        return self._page(request, "personal_data")
+
+    async def _borrowings(self, request: web.Request) -> web.Response:
+        return self._page(request, "borrowings")
+
+    async def _personal_data(self, request: web.Request) -> web.Response:
+        return self._page(request, "personal_data")
+
+    async def _login(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        if not form.get("username") or not form.get("password"):
+            raise web.HTTPFound("/")
+        session = secrets.token_hex(16)
+        self._sessions.add(session)
+        response = web.HTTPFound("/")
+        response.set_cookie(SESSION_COOKIE, session)
+        raise response
+
+    async def _async_start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/", self._root)
+        app.router.add_get("/profile/borrowings/current", self._borrowings)
+        app.router.add_get("/profile/personal-data", self._personal_data)
+        app.router.add_post("/process-login", self._login)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        return f"http://127.0.0.1:{port}/"
+
+    async def _async_stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def __enter__(self) -> Self:
+        """Start server."""
+        self._thread.start()
+        self.url = asyncio.run_coroutine_threadsafe(
+            self._async_start(), self._loop
+        ).result()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        """Stop server."""
+        asyncio.run_coroutine_threadsafe(self._async_stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
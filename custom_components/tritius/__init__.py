@@ -7,15 +7,39 @@ https://github.com/tykovec/home-assistant-tritius
 
 from __future__ import annotations
 
-from homeassistant.const import CONF_PASSWORD, CONF_URL, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant
+import asyncio
+import time
+from datetime import timedelta
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_URL,
+    CONF_USERNAME,
+    EVENT_HOMEASSISTANT_STOP,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.loader import async_get_loaded_integration
 
 from .api import TritiusApiClient
+from .const import (
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_PARSE_WORKERS,
+    CONF_USER_UPDATE_INTERVAL,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_USER_UPDATE_INTERVAL,
+    DOMAIN,
+    PARSE_WORKERS,
+)
 from .coordinator import TritiusDataUpdateCoordinator
 from .data import TritiusConfigEntry, TritiusData
+from .parser import PARSE_EXECUTOR, load_parser
 from .services import async_setup_services
+from .storage import TritiusStore
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
@@ -30,6 +54,18 @@ async def async_setup_entry(
     entry: TritiusConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
+    # durations of setup phases in seconds, reported in diagnostics
+    startup: dict[str, float] = {}
+    start = time.monotonic()
+    PARSE_EXECUTOR.set_workers(_parse_workers(hass))
+
+    @callback
+    def _async_stop_parser(_: Event) -> None:
+        PARSE_EXECUTOR.shutdown()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_parser)
+    )
     client = TritiusApiClient(
         url=entry.data[CONF_URL],
         username=entry.data[CONF_USERNAME],
@@ -37,21 +73,69 @@ async def async_setup_entry(
         session=async_create_clientsession(hass),
     )
 
-    user = await client.async_get_user_data()
+    # reuse session from previous run, login only when it is rejected,
+    # parser stack is imported meanwhile in executor instead of on first parse
+    store = TritiusStore(hass, entry.entry_id)
+    await asyncio.gather(
+        store.async_load(), hass.async_add_import_executor_job(load_parser)
+    )
+    client.restore_cookies(store.cookies)
+    # new session is saved on login, even when data did not change
+    entry.async_on_unload(
+        client.add_login_listener(lambda: store.async_set_cookies(client.cookies))
+    )
+    startup["load"] = time.monotonic() - start
+
+    coordinator = TritiusDataUpdateCoordinator(
+        hass,
+        client,
+        min_update_interval=_interval_option(
+            entry, CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL
+        ),
+        max_update_interval=_interval_option(
+            entry, CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL
+        ),
+        user_update_interval=_interval_option(
+            entry, CONF_USER_UPDATE_INTERVAL, DEFAULT_USER_UPDATE_INTERVAL
+        ),
+    )
+
+    # start from data of previous run, library is contacted in background
+    start = time.monotonic()
+    snapshot = store.snapshot
+    if snapshot is None or snapshot.user is None:
+        await coordinator.async_config_entry_first_refresh()
+        snapshot = None
+        startup["first_refresh"] = time.monotonic() - start
+    else:
+        coordinator.data = snapshot
+        startup["restore"] = time.monotonic() - start
 
-    coordinator = TritiusDataUpdateCoordinator(hass, client)
     entry.runtime_data = TritiusData(
         client=client,
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
-        user=user,
+        store=store,
+        user=coordinator.data.user,
+        startup=startup,
     )
 
-    # load first entities
+    @callback
+    def _async_store_snapshot() -> None:
+        store.async_set_snapshot(coordinator.data)
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_store_snapshot))
+
+    start = time.monotonic()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # fill them with value from first coordimnator loading
-    await coordinator.async_config_entry_first_refresh()
+    # fill entities with data already retrieved or restored
+    coordinator.async_update_listeners()
+    startup["platforms"] = time.monotonic() - start
+    if snapshot is not None:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{entry.title} first refresh"
+        )
 
     await async_setup_services(hass)
 
@@ -60,12 +144,51 @@ async def async_setup_entry(
     return True
 
 
+def _interval_option(
+    entry: TritiusConfigEntry, key: str, default: timedelta
+) -> timedelta:
+    """Get interval option stored in minutes."""
+    if key not in entry.options:
+        return default
+    return timedelta(minutes=entry.options[key])
+
+
+def _parse_workers(hass: HomeAssistant) -> int:
+    """Count of parsing threads, shared pool uses the largest one of accounts."""
+    return max(
+        (
+            int(entry.options.get(CONF_PARSE_WORKERS, PARSE_WORKERS))
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.disabled_by is None
+        ),
+        default=PARSE_WORKERS,
+    )
+
+
 async def async_unload_entry(
     hass: HomeAssistant,
     entry: TritiusConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unloaded := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        # scheduled refreshes of unloaded entry must not poll library anymore
+        await entry.runtime_data.coordinator.async_shutdown()
+        # parsing threads are shared, stop them with last loaded account
+        if not any(
+            other.state is ConfigEntryState.LOADED
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.entry_id != entry.entry_id
+        ):
+            PARSE_EXECUTOR.shutdown()
+    return unloaded
+
+
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: TritiusConfigEntry,
+) -> None:
+    """Remove stored data of entry."""
+    await TritiusStore(hass, entry.entry_id).async_remove()
 
 
 async def async_reload_entry(
@@ -73,5 +196,4 @@ async def async_reload_entry(
     entry: TritiusConfigEntry,
 ) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
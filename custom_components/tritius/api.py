@@ -2,22 +2,50 @@
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import codecs
+import functools
+import random
+import re
 import socket
+import time
 import urllib
 import urllib.parse
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import date, datetime
+from itertools import chain
+from typing import TYPE_CHECKING, Any, overload
 
 import aiohttp
-import async_timeout
-from bs4 import BeautifulSoup, PageElement, Tag
+from aiohttp import hdrs
 from homeassistant.exceptions import HomeAssistantError
-
-from .const import _LOGGER, Selector, Url
-
-
-@dataclass
+from yarl import URL
+
+from .const import (
+    _LOGGER,
+    MAX_BODY_SIZE,
+    MAX_CONCURRENT_PAGES,
+    MAX_CONCURRENT_RENEWALS,
+    PAGE_CACHE_TTL,
+    READ_CHUNK_SIZE,
+    REQUEST_RETRIES,
+    REQUEST_TIMEOUT,
+    RETRY_BACKOFF,
+    Selector,
+    Url,
+)
+from .host import get_host
+from .metrics import TritiusMetrics
+from .parser import PARSE_EXECUTOR, async_find_in_html, content_digest, parse_html
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, PageElement, Tag
+
+
+@dataclass(slots=True, frozen=True)
 class TritiusBorrowing:
     """Tritius borrowing information informations."""
 
@@ -27,7 +55,100 @@ class TritiusBorrowing:
     expiration: date
 
 
-@dataclass
+class TritiusBorrowings(Sequence[TritiusBorrowing]):
+    """Immutable borrowings sorted by expiration, indexed by id."""
+
+    __slots__ = ("_borrowings", "_by_id", "_expirations", "_hash")
+
+    def __init__(self, borrowings: Iterable[TritiusBorrowing] = ()) -> None:
+        """Initialize."""
+        self._borrowings = tuple(
+            sorted(borrowings, key=lambda x: (x.expiration, x.title))
+        )
+        self._by_id = {borrowing.id: borrowing for borrowing in self._borrowings}
+        self._expirations = tuple(
+            borrowing.expiration for borrowing in self._borrowings
+        )
+        self._hash: int | None = None
+
+    @overload
+    def __getitem__(self, index: int) -> TritiusBorrowing: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[TritiusBorrowing, ...]: ...
+
+    def __getitem__(self, index):
+        """Borrowing at position in order of expiration."""
+        return self._borrowings[index]
+
+    def __len__(self) -> int:
+        """Count of borrowings."""
+        return len(self._borrowings)
+
+    def __iter__(self) -> Iterator[TritiusBorrowing]:
+        """Iterate borrowings in order of expiration."""
+        return iter(self._borrowings)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare borrowings, in order of expiration."""
+        if not isinstance(other, TritiusBorrowings):
+            return NotImplemented
+        return self is other or self._borrowings == other._borrowings
+
+    def __hash__(self) -> int:
+        """Hash of borrowings, computed once."""
+        if self._hash is None:
+            self._hash = hash(self._borrowings)
+        return self._hash
+
+    def __repr__(self) -> str:
+        """Represent borrowings."""
+        return f"{type(self).__name__}({list(self._borrowings)!r})"
+
+    @property
+    def nearest_expiration(self) -> date | None:
+        """Expiration of borrowing which expires first."""
+        return self._expirations[0] if self._expirations else None
+
+    def get(self, borrowing_id: int) -> TritiusBorrowing | None:
+        """Borrowing with id."""
+        return self._by_id.get(borrowing_id)
+
+    def expiring(self, until: date) -> tuple[TritiusBorrowing, ...]:
+        """Borrowings expiring on or before day."""
+        return self._borrowings[: bisect.bisect_right(self._expirations, until)]
+
+    def changes(self, previous: TritiusBorrowings) -> TritiusBorrowingChanges:
+        """Compare with previous borrowings, borrowings are matched by id."""
+        if self is previous:
+            return TritiusBorrowingChanges()
+        return TritiusBorrowingChanges(
+            added=tuple(x for x in self._borrowings if previous.get(x.id) is None),
+            removed=tuple(x for x in previous if x.id not in self._by_id),
+            renewed=tuple(
+                (before, x)
+                for x in self._borrowings
+                if (before := previous.get(x.id)) is not None
+                and x.expiration > before.expiration
+            ),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class TritiusBorrowingChanges:
+    """Borrowings added, removed and renewed between two updates."""
+
+    added: tuple[TritiusBorrowing, ...] = ()
+    removed: tuple[TritiusBorrowing, ...] = ()
+    # pairs of borrowing before and after renewal
+    renewed: tuple[tuple[TritiusBorrowing, TritiusBorrowing], ...] = ()
+
+    def __bool__(self) -> bool:
+        """Check whether anything changed."""
+        return bool(self.added or self.removed or self.renewed)
+
+
+@dataclass(slots=True, frozen=True)
 class TritiusUser:
     """Tritius user informations."""
 
@@ -38,6 +159,18 @@ class TritiusUser:
     registration_expiration: date | None
 
 
+@dataclass
+class TritiusResponse:
+    """Response of library server with already read body."""
+
+    url: str
+    text: str
+    redirected: bool
+    etag: str | None = None
+    last_modified: str | None = None
+    not_modified: bool = False
+
+
 class TritiusApiClientError(Exception):
     """Exception to indicate a general API error."""
 
@@ -48,6 +181,15 @@ class TritiusApiClientCommunicationError(
     """Exception to indicate a communication error."""
 
 
+class TritiusHostUnavailableError(TritiusApiClientCommunicationError):
+    """Exception to indicate requests to library are paused after failures."""
+
+    def __init__(self, url: str, retry_after: float) -> None:
+        """Initialize."""
+        super().__init__(f"Library {url} is unavailable for {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
 class TritiusUnknownStructureError(TritiusApiClientError):
     """Exception to indicate unknown structure of html."""
 
@@ -72,6 +214,54 @@ def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     response.raise_for_status()
 
 
+# Charset declared by meta tag, it has to be in first 1024 bytes of page.
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset=["']?([\w.:-]+)""", re.IGNORECASE)
+
+
+def _encoding(charset: str | None, body: bytes) -> str:
+    """Detect encoding of page from header, meta tag of page or use utf-8."""
+    if charset is None and (meta := _META_CHARSET.search(body, 0, 1024)):
+        charset = meta.group(1).decode("ascii")
+    if charset is not None:
+        try:
+            return codecs.lookup(charset).name
+        except LookupError:
+            _LOGGER.debug("Unknown charset %s, decoding as utf-8", charset)
+    return "utf-8"
+
+
+async def _read_text(
+    response: aiohttp.ClientResponse, max_size: int = MAX_BODY_SIZE
+) -> str:
+    """Stream response body, refuse bodies larger than max size."""
+    if response.content_length is not None and response.content_length > max_size:
+        raise TritiusApiClientCommunicationError(
+            f"Response of {response.content_length} bytes exceeds {max_size} bytes"
+        )
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+        body += chunk
+        if len(body) > max_size:
+            raise TritiusApiClientCommunicationError(
+                f"Response exceeds {max_size} bytes"
+            )
+    encoding = _encoding(response.charset, body)
+    try:
+        return body.decode(encoding)
+    except UnicodeDecodeError as exception:
+        raise TritiusUnknownStructureError(
+            f"Response is not valid {encoding} - {exception}"
+        ) from exception
+
+
+def _is_transient(exception: TritiusApiClientCommunicationError) -> bool:
+    """Check whether error is caused by temporary network or server failure."""
+    cause = exception.__cause__
+    if isinstance(cause, aiohttp.ClientResponseError):
+        return cause.status >= 500 or cause.status == 429
+    return cause is not None
+
+
 def _get_form_inputs(tag: Tag) -> dict[str, str]:
     """Get form data for tag."""
     inputs = tag.select("input")
@@ -104,18 +294,102 @@ def _select_one(tag: Tag, selector: str) -> Tag:
     return s
 
 
-class TritiusAuthenticatedContext:
-    """Context for telling that we are authenticated."""
+def _iter_borrowings(html: BeautifulSoup) -> Iterator[TritiusBorrowing]:
+    """Extract borrowings from rows of borrowings page one by one."""
+    items = html.select(
+        Selector.PORTLET_BORROWINGS + " " + Selector.PORTLET_BORROWINGS_DATA
+    )
+
+    for item in items:
+        tds = item.select("td")
+        form = _select_one(tds[7], "form")
+        id_tag = _select_one(form, "input[name='id']")
+        borrowing_id = int(id_tag.attrs["value"])
+        expiration = _formatdate(tds[2])
+        yield TritiusBorrowing(
+            author=_format(tds[5]),
+            title=_format(_select_one(tds[4], "a")),
+            id=borrowing_id,
+            expiration=expiration,
+        )
+
+
+def _extract_user(url: str, html: BeautifulSoup) -> TritiusUser:
+    """Extract user data from profile page."""
+    pers_data = _select_one(html, Selector.PORTLET_PERSONAL_DATA)
+
+    registration_expiration = _formatdate(
+        _select_one(html, Selector.REGISTRATION_EXPIRATION)
+    )
+
+    input_data = _get_form_inputs(pers_data)
+
+    return TritiusUser(
+        url,
+        input_data.get("values[readerNumber]", ""),
+        input_data.get("values[firstname]", ""),
+        input_data.get("values[lastname]", ""),
+        registration_expiration,
+    )
+
+
+def _page_count(html: BeautifulSoup) -> int:
+    """Count of borrowings pages, pages are numbered from 1 by page parameter."""
+    count = 1
+    for link in html.select(Selector.PORTLET_BORROWINGS + " " + Selector.PAGINATION):
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(str(link["href"])).query)
+        for page in query.get("page", ()):
+            if page.isdigit():
+                count = max(count, int(page))
+    return count
+
+
+def _renew_forms(
+    html: BeautifulSoup, page_url: str
+) -> dict[int, tuple[str, dict[str, str]]]:
+    """Absolute urls and data of renewal forms of borrowings rows by borrowing id.
+
+    Actions are resolved against url of page, as browser does.
+    """
+    forms: dict[int, tuple[str, dict[str, str]]] = {}
+    for form in html.select(
+        f"{Selector.PORTLET_BORROWINGS} {Selector.PORTLET_BORROWINGS_DATA} "
+        f"{Selector.RENEW_FORM}"
+    ):
+        id_tag = _select_one(form, "input[name='id']")
+        if not (action := form.get("action")):
+            raise TritiusUnknownStructureError("Renewal form without action")
+        forms[int(id_tag.attrs["value"])] = (
+            urllib.parse.urljoin(page_url, str(action)),
+            _get_form_inputs(form),
+        )
+    return forms
+
+
+def _extract_borrowings_page(
+    html: BeautifulSoup,
+) -> tuple[tuple[TritiusBorrowing, ...], int]:
+    """Extract borrowings of one page and count of all pages."""
+    return tuple(_iter_borrowings(html)), _page_count(html)
 
-    def __init__(self):
-        """Initialize class."""
 
-    def __enter__(self):
-        """Enter resource usage."""
-        return self
+def _extract_changed[T](
+    text: str,
+    only: tuple[Selector, ...],
+    extract: Callable[[BeautifulSoup], T],
+    previous_digest: str | None,
+) -> tuple[str | None, T | None, float | None]:
+    """Digest subtrees and extract data when digest differs from previous.
 
-    def __exit__(self, exception_type, exception_value, traceback):
-        """Exit resource usage."""
+    Runs in parse executor, returns digest, extracted data and duration of
+    extraction, data and duration are None when content did not change.
+    """
+    digest = content_digest(text, only)
+    if digest is not None and digest == previous_digest:
+        return digest, None, None
+    start = time.monotonic()
+    result = extract(parse_html(text, only))
+    return digest, result, time.monotonic() - start
 
 
 class TritiusApiConnection:
@@ -127,6 +401,8 @@ class TritiusApiConnection:
         username: str,
         password: str,
         session: aiohttp.ClientSession,
+        page_cache_ttl: float = PAGE_CACHE_TTL,
+        retries: int = REQUEST_RETRIES,
     ) -> None:
         """Tritius scraper Client."""
         parsed = urllib.parse.urlsplit(url)
@@ -140,58 +416,162 @@ class TritiusApiConnection:
         self.username = username
         self.password = password
         self._session = session
-        self._cx = None
-
-    async def get(self, url: str = "", data: dict | None = None) -> BeautifulSoup:
-        """Get operation."""
-        page = await self._api_wrapper("get", url, data)
-
-        soup = BeautifulSoup(await page.text(), "html.parser")
-
-        if self._cx is not None:
-            _LOGGER.debug("Running in authorization context, omit login checking")
-        else:
-            _LOGGER.debug("Ensures logged in")
-            form = soup.select_one(Selector.LOGIN_FORM)
-            if form is not None:
-                _LOGGER.debug("Login form found try to login")
-                inputs = _get_form_inputs(form)
-                inputs["username"] = self.username
-                inputs["password"] = self.password
-                form = await self.post(Url.LOGIN, data=inputs, omitErrorParsing=True)
-
-                _LOGGER.debug("Retrieve page again")
-                page = await self._api_wrapper("get", url, data)
-                soup = BeautifulSoup(await page.text(), "html.parser")
-                form = soup.select_one(Selector.LOGIN_FORM)
-                if form is not None:
-                    _LOGGER.debug("Login page found raising error")
-                    raise TritiusApiClientAuthenticationError
-
-        return soup
+        self._host = get_host(self.url)
+        self._login_lock = asyncio.Lock()
+        self._logins = 0
+        self._login_listeners: list[Callable[[], None]] = []
+        self._pages: dict[str, tuple[float, str]] = {}
+        self._validated: dict[str, TritiusResponse] = {}
+        self._page_cache_ttl = page_cache_ttl
+        self._retries = retries
+        self.metrics = TritiusMetrics()
+
+    async def get(
+        self,
+        url: str = "",
+        data: dict | None = None,
+        only: tuple[Selector, ...] = (),
+        max_age: float | None = None,
+    ) -> BeautifulSoup:
+        """Get operation, parse only subtrees of selectors when given."""
+        text = await self.get_text(url, data, max_age)
+        return await PARSE_EXECUTOR.async_run(parse_html, text, only)
+
+    async def get_text(
+        self,
+        url: str = "",
+        data: dict | None = None,
+        max_age: float | None = None,
+    ) -> str:
+        """Get operation returning page text.
+
+        Page retrieved less than max_age seconds ago is taken from cache,
+        page cache ttl of connection is used when not given.
+        """
+        if max_age is None:
+            max_age = self._page_cache_ttl
+        cached = self._pages.get(url) if data is None else None
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            _LOGGER.debug("Using cached page %s", url)
+            return cached[1]
+
+        text = await self._async_get_text(url, data)
+        if data is None:
+            self._pages[url] = (time.monotonic(), text)
+        return text
+
+    async def _async_get_text(self, url: str, data: dict | None) -> str:
+        """Get page text, login when login form is returned."""
+        logins = self._logins
+        text = await self._async_get_validated(url, data)
+
+        form = await async_find_in_html(text, Selector.LOGIN_FORM)
+        if form is not None:
+            await self._async_login(form, logins)
+
+            _LOGGER.debug("Retrieve page again")
+            text = await self._async_get_validated(url, data)
+            if await async_find_in_html(text, Selector.LOGIN_FORM) is not None:
+                _LOGGER.debug("Login page found raising error")
+                raise TritiusApiClientAuthenticationError
+
+        return text
+
+    async def _async_get_validated(self, url: str, data: dict | None) -> str:
+        """Get page conditionally when server supplied validators for it."""
+        headers: dict[str, str] = {}
+        if (validated := self._validated.get(url)) is not None:
+            if validated.etag is not None:
+                headers["If-None-Match"] = validated.etag
+            if validated.last_modified is not None:
+                headers["If-Modified-Since"] = validated.last_modified
+
+        response = await self._api_wrapper("get", url, data, headers or None)
+        if response.not_modified and validated is not None:
+            _LOGGER.debug("Page %s not modified", url)
+            return validated.text
+        if (
+            response.etag is not None or response.last_modified is not None
+        ) and await async_find_in_html(response.text, Selector.LOGIN_FORM) is None:
+            self._validated[url] = response
+        return response.text
+
+    async def _async_login(self, form: Tag, logins: int) -> None:
+        """Login with form, once for all requests rejected concurrently."""
+        async with self._login_lock:
+            if self._logins != logins:
+                _LOGGER.debug("Logged in by concurrent request")
+                return
+            _LOGGER.debug("Login form found try to login")
+            inputs = _get_form_inputs(form)
+            inputs["username"] = self.username
+            inputs["password"] = self.password
+            await self.post(
+                Url.LOGIN,
+                data=inputs,
+                omitErrorParsing=True,
+            )
+            self._logins += 1
+            self.metrics.logins += 1
+            for listener in list(self._login_listeners):
+                listener()
+
+    def add_login_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener after each successful login, return remover."""
+        self._login_listeners.append(listener)
+        return lambda: self._login_listeners.remove(listener)
 
     async def post(
-        self, url: str, data: dict | None = None, omitErrorParsing=False
-    ) -> BeautifulSoup | None:
-        """Post operation."""
+        self,
+        url: str,
+        data: dict | None = None,
+        omitErrorParsing=False,
+        cache_redirect: bool = True,
+    ) -> str:
+        """Post operation returning text of resulting page.
+
+        Redirect target is not cached when posts run concurrently, page could
+        be rendered before other post was processed.
+        """
         page = await self._api_wrapper("post", url, data)
-        soap = BeautifulSoup(await page.text(), "html.parser")
+        text = page.text
+
+        # posted data could change any page, keep only redirect target
+        self._pages.clear()
+        target = page.url
+        if (
+            cache_redirect
+            and page.redirected
+            and target.startswith(self.url)
+            and await async_find_in_html(text, Selector.LOGIN_FORM) is None
+        ):
+            _LOGGER.debug("Caching page %s redirected from %s", target, url)
+            self._pages[target.removeprefix(self.url)] = (time.monotonic(), text)
+
         if not omitErrorParsing:
-            alert = soap.select_one("div.flash-messages div.alert-danger span")
+            alert = await async_find_in_html(text, Selector.FLASH_ALERT)
             if alert is not None:
                 raise TritiusApplicationError(alert.text)
 
-        return soap
+        return text
 
-    @asynccontextmanager
-    async def authorized(self):
-        """Enforce authorization for all next calls."""
-        try:
-            await self.get()
-            self._cx = TritiusAuthenticatedContext()
-            yield self._cx
-        finally:
-            self._cx = None
+    def absolute_url(self, url: str) -> str:
+        """Resolve url relative to library url, absolute ones are kept."""
+        return urllib.parse.urljoin(self.url, url)
+
+    @property
+    def cookies(self) -> dict[str, str]:
+        """Session cookies for library url."""
+        return {
+            name: morsel.value
+            for name, morsel in self._session.cookie_jar.filter_cookies(
+                URL(self.url)
+            ).items()
+        }
+
+    def restore_cookies(self, cookies: dict[str, str]) -> None:
+        """Restore session cookies for library url."""
+        self._session.cookie_jar.update_cookies(cookies, URL(self.url))
 
     async def _api_wrapper(
         self,
@@ -199,17 +579,82 @@ class TritiusApiConnection:
         url: str,
         data: dict | None = None,
         headers: dict | None = None,
-    ) -> aiohttp.ClientResponse:
-        """Get information from the API."""
-        try:
-            async with async_timeout.timeout(10):
-                _LOGGER.debug("Calling %s %s", method, self.url + url)
-                response = await self._session.request(
-                    method=method, url=self.url + url, headers=headers, data=data
-                )
-                _verify_response_or_raise(response)
+    ) -> TritiusResponse:
+        """Get information from the API.
+
+        Idempotent get is retried with exponential backoff and jitter, nothing
+        is sent while circuit of library is open.
+        """
+        attempts = 1 + (self._retries if method == "get" else 0)
+        for attempt in range(attempts):
+            if (retry_after := self._host.retry_after) is not None:
+                raise TritiusHostUnavailableError(self.url, retry_after)
+            try:
+                response = await self._api_request(method, url, data, headers)
+            except TritiusApiClientCommunicationError as exception:
+                self.metrics.errors[
+                    type(exception.__cause__ or exception).__name__
+                ] += 1
+                if not _is_transient(exception):
+                    self._host.record_success()
+                    raise
+                self._host.record_failure()
+                if attempt == attempts - 1:
+                    raise
+                delay = RETRY_BACKOFF * 2**attempt * random.uniform(1, 1.5)
+                _LOGGER.debug("Retrying %s %s in %.1fs", method, url, delay)
+                await asyncio.sleep(delay)
+            except TritiusApiClientError:
+                self._host.record_success()
+                raise
+            else:
+                self._host.record_success()
                 return response
 
+    async def _api_request(
+        self,
+        method: str,
+        url: str,
+        data: dict | None,
+        headers: dict | None,
+    ) -> TritiusResponse:
+        """Send one request to the API.
+
+        Body is read within request timeout and connection is always released.
+        """
+        url = self.absolute_url(url)
+        _LOGGER.debug("Calling %s %s", method, url)
+        try:
+            async with self._host.limit():
+                # latency of library, without waiting for request limits
+                start = time.monotonic()
+                self.metrics.requests[method] += 1
+                try:
+                    async with (
+                        asyncio.timeout(REQUEST_TIMEOUT),
+                        self._session.request(
+                            method=method,
+                            url=url,
+                            headers=headers,
+                            data=data,
+                        ) as response,
+                    ):
+                        _verify_response_or_raise(response)
+                        text = await _read_text(response)
+                        self.metrics.bytes_received += response.content.total_bytes
+                        return TritiusResponse(
+                            url=str(response.url),
+                            text=text,
+                            redirected=bool(response.history),
+                            etag=response.headers.get(hdrs.ETAG),
+                            last_modified=response.headers.get(hdrs.LAST_MODIFIED),
+                            not_modified=response.status == 304,
+                        )
+                finally:
+                    self.metrics.request_latency.observe(time.monotonic() - start)
+
+        except TritiusApiClientError:
+            raise
         except TimeoutError as exception:
             msg = f"Timeout error fetching information - {exception}"
             raise TritiusApiClientCommunicationError(
@@ -238,76 +683,178 @@ class TritiusApiClient:
         username: str,
         password: str,
         session: aiohttp.ClientSession,
+        page_cache_ttl: float = PAGE_CACHE_TTL,
+        retries: int = REQUEST_RETRIES,
     ) -> None:
         """Tritius scraper Client."""
-        self._connection = TritiusApiConnection(url, username, password, session)
+        self._connection = TritiusApiConnection(
+            url,
+            username,
+            password,
+            session,
+            page_cache_ttl,
+            retries,
+        )
+        self._extracted: dict[str, tuple[str, Any]] = {}
+
+    @property
+    def metrics(self) -> TritiusMetrics:
+        """Instrumentation of requests and parsing."""
+        return self._connection.metrics
+
+    @property
+    def cookies(self) -> dict[str, str]:
+        """Session cookies, login can be skipped when restored."""
+        return self._connection.cookies
+
+    def restore_cookies(self, cookies: dict[str, str]) -> None:
+        """Restore session cookies from previous run."""
+        self._connection.restore_cookies(cookies)
+
+    def add_login_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener after each login, when session cookies change."""
+        return self._connection.add_login_listener(listener)
 
     @asynccontextmanager
     async def authorized(self):
-        """Run client in authorized context."""
-        async with self._connection.authorized():
-            yield
+        """Group calls needing login, it does not login by itself.
 
-    async def async_get_user_data(self) -> TritiusUser:
-        """Parse user data from profile page."""
-        html = await self._connection.get(Url.PERSONAL_DATA)
-        pers_data = _select_one(html, Selector.PORTLET_PERSONAL_DATA)
+        Login is lazy, it happens on first request rejected with login form,
+        once for all requests rejected concurrently.
+        """
+        yield
 
-        registration_expiration = _formatdate(
-            _select_one(html, Selector.REGISTRATION_EXPIRATION)
+    async def _async_extract[T](
+        self,
+        url: str,
+        only: tuple[Selector, ...],
+        extract: Callable[[BeautifulSoup], T],
+    ) -> T:
+        """Extract data from page, reuse them when subtrees did not change."""
+        text = await self._connection.get_text(url)
+        previous = self._extracted.get(url)
+        digest, result, duration = await PARSE_EXECUTOR.async_run(
+            _extract_changed,
+            text,
+            only,
+            extract,
+            None if previous is None else previous[0],
         )
+        if duration is None and previous is not None:
+            _LOGGER.debug("Content of %s unchanged, reusing extracted data", url)
+            return previous[1]
 
-        input_data = _get_form_inputs(pers_data)
+        self.metrics.observe_parse(url, duration)
+        if digest is not None:
+            self._extracted[url] = (digest, result)
+        return result
 
-        return TritiusUser(
-            self._connection.url,
-            input_data.get("values[readerNumber]", ""),
-            input_data.get("values[firstname]", ""),
-            input_data.get("values[lastname]", ""),
-            registration_expiration,
+    async def async_get_user_data(self) -> TritiusUser:
+        """Parse user data from profile page."""
+        return await self._async_extract(
+            Url.PERSONAL_DATA,
+            (Selector.PORTLET_PERSONAL_DATA, Selector.REGISTRATION_EXPIRATION),
+            functools.partial(_extract_user, self._connection.url),
         )
 
-    async def async_get_borrowings(self) -> list[TritiusBorrowing] | None:
-        """Get list of borrowings."""
-
-        borrowings_page = await self.async_get_borrowings_page()
+    async def async_get_borrowings(self) -> TritiusBorrowings | None:
+        """Get list of borrowings, following pages of long lists."""
+        rows, count = await self._async_get_borrowings_page(Url.BORROWINGS)
+        if count == 1:
+            return TritiusBorrowings(rows)
 
-        items = borrowings_page.select(
-            Selector.PORTLET_BORROWINGS + " " + Selector.PORTLET_BORROWINGS_DATA
-        )
+        _LOGGER.debug("Borrowings are split to %s pages", count)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
 
-        borrowings: list[TritiusBorrowing] = []
-        for item in items:
-            tds = item.select("td")
-            form = _select_one(tds[7], "form")
-            id_tag = _select_one(form, "input[name='id']")
-            borrowing_id = int(id_tag.attrs["value"])
-            expiration = _formatdate(tds[2])
-            borrowings.append(
-                TritiusBorrowing(
-                    author=_format(tds[5]),
-                    title=_format(_select_one(tds[4], "a")),
-                    id=borrowing_id,
-                    expiration=expiration,
+        async def _async_get_rows(page: int) -> tuple[TritiusBorrowing, ...]:
+            async with semaphore:
+                rows, _ = await self._async_get_borrowings_page(
+                    f"{Url.BORROWINGS}?page={page}"
                 )
-            )
-        borrowings.sort(key=lambda x: (x.expiration, x.title))
-        return borrowings
+            return rows
+
+        pages = await asyncio.gather(
+            *(_async_get_rows(page) for page in range(2, count + 1))
+        )
+        return TritiusBorrowings(chain(rows, *pages))
+
+    async def _async_get_borrowings_page(
+        self, url: str
+    ) -> tuple[tuple[TritiusBorrowing, ...], int]:
+        """Get borrowings of one page, its tree is released once rows are read."""
+        return await self._async_extract(
+            url, (Selector.PORTLET_BORROWINGS,), _extract_borrowings_page
+        )
 
     async def async_renew_borrowings(self) -> bool:
         """Renew all borrowings."""
-        borrowings_page = await self.async_get_borrowings_page()
+        borrowings_page = await self.async_get_borrowings_page(Selector.RENEW_ALL_FORM)
         form = borrowings_page.select_one(Selector.RENEW_ALL_FORM)
         if form is None:
             _LOGGER.debug("Nothing to renew")
             return False
         try:
-            await self._connection.post(Url.RENEW_ALL, data=_get_form_inputs(form))
+            await self._connection.post(
+                Url.RENEW_ALL,
+                data=_get_form_inputs(form),
+            )
         except Exception as e:
             raise HomeAssistantError(e) from e
 
         return True
 
-    async def async_get_borrowings_page(self) -> BeautifulSoup:
+    async def async_renew_borrowing_ids(
+        self, borrowing_ids: Iterable[int]
+    ) -> dict[int, bool]:
+        """Renew borrowings with ids, return whether each of them was renewed."""
+        ids = sorted(set(borrowing_ids))
+        if not ids:
+            return {}
+        forms = await self._async_get_renew_forms(set(ids))
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_RENEWALS)
+
+        async def _async_renew(borrowing_id: int) -> bool:
+            if (form := forms.get(borrowing_id)) is None:
+                _LOGGER.debug("Borrowing %s cannot be renewed", borrowing_id)
+                return False
+            url, data = form
+            async with semaphore:
+                try:
+                    await self._connection.post(
+                        url,
+                        data=data,
+                        cache_redirect=False,
+                    )
+                except TritiusApplicationError as e:
+                    _LOGGER.debug("Borrowing %s not renewed: %s", borrowing_id, e)
+                    return False
+                except Exception as e:
+                    raise HomeAssistantError(e) from e
+            return True
+
+        renewed = await asyncio.gather(*(_async_renew(x) for x in ids))
+        return dict(zip(ids, renewed, strict=True))
+
+    async def _async_get_renew_forms(
+        self, borrowing_ids: set[int]
+    ) -> dict[int, tuple[str, dict[str, str]]]:
+        """Renewal forms of borrowings, pages are read until all are found."""
+        html = await self.async_get_borrowings_page(Selector.PORTLET_BORROWINGS)
+        forms = _renew_forms(html, self._connection.absolute_url(Url.BORROWINGS))
+        for page in range(2, _page_count(html) + 1):
+            if borrowing_ids <= forms.keys():
+                break
+            url = f"{Url.BORROWINGS}?page={page}"
+            forms.update(
+                _renew_forms(
+                    await self._connection.get(
+                        url, only=(Selector.PORTLET_BORROWINGS,)
+                    ),
+                    self._connection.absolute_url(url),
+                )
+            )
+        return forms
+
+    async def async_get_borrowings_page(self, *only: Selector) -> BeautifulSoup:
         """Get convenience borrowing page."""
-        return await self._connection.get(Url.BORROWINGS)
+        return await self._connection.get(Url.BORROWINGS, only=only)
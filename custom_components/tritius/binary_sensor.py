@@ -67,4 +67,4 @@ class TritiusBinarySensor(TritiusEntity, BinarySensorEntity):
     @callback
     def _handle_coordinator_update(self):
         self._attr_is_on = self.entity_description.value_fn(self.coordinator.data)
-        super().async_write_ha_state()
+        self._async_write_ha_state_if_changed(self._attr_is_on)
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import voluptuous as vol
 from homeassistant import config_entries, data_entry_flow
 from homeassistant.const import CONF_PASSWORD, CONF_URL, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
@@ -15,7 +18,18 @@ from .api import (
     TritiusApiClientError,
     TritiusUser,
 )
-from .const import _LOGGER, DOMAIN
+from .const import (
+    _LOGGER,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_PARSE_WORKERS,
+    CONF_USER_UPDATE_INTERVAL,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_USER_UPDATE_INTERVAL,
+    DOMAIN,
+    PARSE_WORKERS,
+)
 
 
 class TritiusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -23,6 +37,14 @@ class TritiusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> TritiusOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return TritiusOptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self,
         user_input: dict | None = None,
@@ -97,3 +119,81 @@ class TritiusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             session=session,
         )
         return await client.async_get_user_data()
+
+
+class TritiusOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for Tritius."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> data_entry_flow.FlowResult:
+        """Manage update intervals in minutes and count of parsing threads."""
+        _errors = {}
+        if user_input is not None:
+            if (
+                user_input[CONF_MAX_UPDATE_INTERVAL]
+                < user_input[CONF_MIN_UPDATE_INTERVAL]
+            ):
+                _errors["base"] = "update_interval"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = user_input or self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MIN_UPDATE_INTERVAL,
+                        default=options.get(
+                            CONF_MIN_UPDATE_INTERVAL,
+                            DEFAULT_MIN_UPDATE_INTERVAL.total_seconds() // 60,
+                        ),
+                    ): _interval_selector(),
+                    vol.Required(
+                        CONF_MAX_UPDATE_INTERVAL,
+                        default=options.get(
+                            CONF_MAX_UPDATE_INTERVAL,
+                            DEFAULT_MAX_UPDATE_INTERVAL.total_seconds() // 60,
+                        ),
+                    ): _interval_selector(),
+                    vol.Required(
+                        CONF_USER_UPDATE_INTERVAL,
+                        default=options.get(
+                            CONF_USER_UPDATE_INTERVAL,
+                            DEFAULT_USER_UPDATE_INTERVAL.total_seconds() // 60,
+                        ),
+                    ): _interval_selector(),
+                    vol.Required(
+                        CONF_PARSE_WORKERS,
+                        default=options.get(CONF_PARSE_WORKERS, PARSE_WORKERS),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=8,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                        ),
+                    ),
+                },
+            ),
+            errors=_errors,
+        )
+
+
+def _interval_selector() -> selector.NumberSelector:
+    """Selector of update interval in minutes."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=5,
+            max=7 * 24 * 60,
+            step=5,
+            unit_of_measurement="min",
+            mode=selector.NumberSelectorMode.BOX,
+        ),
+    )
@@ -8,8 +8,54 @@ _LOGGER: Logger = getLogger(__package__)
 
 DOMAIN = "tritius"
 SERVICE_RENEW_BORROWINGS = "renew_borrowings"
+ATTR_BORROWING_IDS = "borrowing_ids"
+EVENT_BORROWING_ADDED = f"{DOMAIN}_borrowing_added"
+EVENT_BORROWING_REMOVED = f"{DOMAIN}_borrowing_removed"
+EVENT_BORROWING_RENEWED = f"{DOMAIN}_borrowing_renewed"
 ALERT_DELTA: timedelta = timedelta(days=1)
 
+CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
+CONF_USER_UPDATE_INTERVAL = "user_update_interval"
+DEFAULT_MIN_UPDATE_INTERVAL: timedelta = timedelta(hours=1)
+DEFAULT_MAX_UPDATE_INTERVAL: timedelta = timedelta(hours=12)
+# Personal data change rarely, they are updated less often than borrowings.
+DEFAULT_USER_UPDATE_INTERVAL: timedelta = timedelta(days=1)
+
+# Seconds for request including reading of its body.
+REQUEST_TIMEOUT = 10
+# Largest accepted page and size of chunks it is read by.
+MAX_BODY_SIZE = 5 * 1024 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+# Maximum of simultaneous requests to library server.
+MAX_CONCURRENT_REQUESTS = 2
+# Requests per second to library server shared by all accounts and its burst.
+REQUEST_RATE = 2.0
+REQUEST_BURST = 5
+# Maximum of further borrowings pages fetched simultaneously.
+MAX_CONCURRENT_PAGES = 4
+# Maximum of single borrowings renewed simultaneously.
+MAX_CONCURRENT_RENEWALS = 4
+# Maximum of libraries processed simultaneously by services.
+MAX_CONCURRENT_SERVICE_HOSTS = 4
+# Retries of failed idempotent requests, delay before first retry in seconds.
+REQUEST_RETRIES = 2
+RETRY_BACKOFF = 1.0
+# Consecutive failures of library before its requests are paused and for how
+# many seconds, pause doubles while library keeps failing.
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_OPEN_TIME = 60
+CIRCUIT_MAX_OPEN_TIME = 3600
+# Maximal random delay added to update interval to spread accounts in time.
+UPDATE_JITTER: timedelta = timedelta(minutes=5)
+# Upper bounds in seconds of buckets of request, parse and refresh durations.
+DURATION_BUCKETS: tuple[float, ...] = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+# Threads parsing html outside of event loop, zero parses in event loop.
+CONF_PARSE_WORKERS = "parse_workers"
+PARSE_WORKERS = 2
+# Seconds for which retrieved page is reused instead of downloading again.
+PAGE_CACHE_TTL = 60
+
 
 class Url(StrEnum):
     """Urls used for data fetching."""
@@ -24,8 +70,11 @@ class Selector(StrEnum):
     """Selectors for data scrapping."""
 
     LOGIN_FORM = "form.login-form"
+    FLASH_ALERT = "div.flash-messages div.alert-danger span"
     REGISTRATION_EXPIRATION = "#navbar li.dropdown-user li.hidden-xs span.dropdown-text"
     PORTLET_PERSONAL_DATA = "#portlet-personal-data"
     PORTLET_BORROWINGS = "#borrowings-portlet"
     PORTLET_BORROWINGS_DATA = ".portlet-content table tbody tr"
+    RENEW_FORM = "form:has(input[name='id'])"
+    PAGINATION = "ul.pagination a[href]"
     RENEW_ALL_FORM = f"form[action='/{Url.RENEW_ALL}']"
@@ -2,22 +2,44 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import random
+import time
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
     TritiusApiClient,
     TritiusApiClientAuthenticationError,
     TritiusApiClientError,
     TritiusBorrowing,
+    TritiusBorrowings,
+    TritiusHostUnavailableError,
     TritiusUser,
 )
-from .const import _LOGGER, ALERT_DELTA, DOMAIN
+from .const import (
+    _LOGGER,
+    ALERT_DELTA,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_USER_UPDATE_INTERVAL,
+    DOMAIN,
+    EVENT_BORROWING_ADDED,
+    EVENT_BORROWING_REMOVED,
+    EVENT_BORROWING_RENEWED,
+    UPDATE_JITTER,
+    Url,
+)
+
+# Delay after midnight so day of alert has surely changed.
+MIDNIGHT_DELAY: timedelta = timedelta(minutes=1)
 
 
 @dataclass  # noqa: F821
@@ -25,42 +47,182 @@ class TritiusCoordinatorData:
     """All data retrieved by api."""
 
     user: TritiusUser | None
-    borrowings: list[TritiusBorrowing] | None
+    borrowings: TritiusBorrowings | None
     borrowing_expiration: date | None
+    # alert depends on day, so data of different days are never equal
+    day: date = field(default_factory=lambda: dt_util.now().date())
 
     def has_borrowing_alert(self) -> bool:
         """Borrowing alert of data."""
         return self.borrowing_expiration is not None and self.borrowing_expiration <= (
-            date.today() + ALERT_DELTA
+            dt_util.now().date() + ALERT_DELTA
         )
 
 
 class TritiusDataUpdateCoordinator(DataUpdateCoordinator[TritiusCoordinatorData]):
     """Class to manage fetching data from the API."""
 
-    def __init__(self, hass: HomeAssistant, client: TritiusApiClient) -> None:
-        """Initialize."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: TritiusApiClient,
+        min_update_interval: timedelta = DEFAULT_MIN_UPDATE_INTERVAL,
+        max_update_interval: timedelta = DEFAULT_MAX_UPDATE_INTERVAL,
+        user_update_interval: timedelta = DEFAULT_USER_UPDATE_INTERVAL,
+    ) -> None:
+        """Initialize.
+
+        Borrowings are updated on every refresh, personal data once per user
+        update interval or when requested.
+        """
         super().__init__(
             hass=hass,
             logger=_LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(hours=1),
+            update_interval=min_update_interval,
+            # listeners are not notified when data did not change
+            always_update=False,
         )
         self._client = client
+        self._min_update_interval = min_update_interval
+        self._max_update_interval = max(min_update_interval, max_update_interval)
+        self._user_update_interval = user_update_interval
+        # monotonic time of last personal data update, None to update on refresh
+        self._user_updated: float | None = None
+        self.page_timings: dict[str, float] = {}
+
+    @callback
+    def request_user_refresh(self) -> None:
+        """Update personal data on next refresh."""
+        self._user_updated = None
+
+    def _user_outdated(self) -> bool:
+        """Check whether personal data should be updated by refresh."""
+        return (
+            self.data is None
+            or self.data.user is None
+            or self._user_updated is None
+            or time.monotonic() - self._user_updated
+            >= self._user_update_interval.total_seconds()
+        )
+
+    async def _async_timed[T](self, page: str, awaitable: Awaitable[T]) -> T:
+        """Await page retrieval and remember its duration."""
+        start = time.monotonic()
+        try:
+            return await awaitable
+        finally:
+            self.page_timings[page] = time.monotonic() - start
+            _LOGGER.debug("Page %s took %.3fs", page, self.page_timings[page])
+
+    def _next_update_interval(self, data: TritiusCoordinatorData) -> timedelta:
+        """Derive interval of next update from expiration of borrowings.
+
+        Poll densely while alert is on, otherwise at midnight when alert starts.
+        """
+        if data.borrowing_expiration is None:
+            interval = self._max_update_interval
+        else:
+            alert_start = dt_util.start_of_local_day(
+                data.borrowing_expiration - ALERT_DELTA
+            )
+            interval = alert_start + MIDNIGHT_DELAY - dt_util.now()
+        return min(max(interval, self._min_update_interval), self._max_update_interval)
 
     async def _async_update_data(self) -> Any:
-        """Update data via library."""
+        """Update data via library, remember duration of refresh."""
+        start = time.monotonic()
+        try:
+            return await self._async_fetch_data()
+        finally:
+            self._client.metrics.refresh_duration.observe(time.monotonic() - start)
+
+    async def _async_fetch_data(self) -> TritiusCoordinatorData:
+        """Fetch pages and derive interval of next update."""
+        # retry failed update soon
+        self.update_interval = _jittered(self._min_update_interval)
         try:
             async with self._client.authorized():
-                borrowings = await self._client.async_get_borrowings()
-                return TritiusCoordinatorData(
-                    user=await self._client.async_get_user_data(),
+                if self._user_outdated():
+                    # pages are independent once authorized
+                    borrowings, user = await asyncio.gather(
+                        self._async_timed(
+                            Url.BORROWINGS, self._client.async_get_borrowings()
+                        ),
+                        self._async_timed(
+                            Url.PERSONAL_DATA, self._client.async_get_user_data()
+                        ),
+                    )
+                    self._user_updated = time.monotonic()
+                else:
+                    borrowings = await self._async_timed(
+                        Url.BORROWINGS, self._client.async_get_borrowings()
+                    )
+                    user = self.data.user
+                data = TritiusCoordinatorData(
+                    user=user,
                     borrowings=borrowings,
-                    borrowing_expiration=borrowings[0].expiration
-                    if bool(borrowings)
-                    else None,
+                    borrowing_expiration=None
+                    if borrowings is None
+                    else borrowings.nearest_expiration,
                 )
         except TritiusApiClientAuthenticationError as exception:
             raise ConfigEntryAuthFailed(exception) from exception
+        except TritiusHostUnavailableError as exception:
+            # back off until library is expected to respond again
+            self.update_interval = _jittered(
+                max(self._min_update_interval, timedelta(seconds=exception.retry_after))
+            )
+            raise UpdateFailed(exception) from exception
         except TritiusApiClientError as exception:
             raise UpdateFailed(exception) from exception
+
+        self._fire_borrowing_events(data)
+        self.update_interval = _jittered(self._next_update_interval(data))
+        _LOGGER.debug("Next update in %s", self.update_interval)
+        return data
+
+    @callback
+    def _fire_borrowing_events(self, data: TritiusCoordinatorData) -> None:
+        """Fire events of borrowings changed since previous data."""
+        if self.data is None or self.data.borrowings is None or data.borrowings is None:
+            return
+        changes = data.borrowings.changes(self.data.borrowings)
+        if not changes:
+            return
+        _LOGGER.debug(
+            "Borrowings added %s, removed %s, renewed %s",
+            len(changes.added),
+            len(changes.removed),
+            len(changes.renewed),
+        )
+        entry_id = None if self.config_entry is None else self.config_entry.entry_id
+        fire = self.hass.bus.async_fire
+        for borrowing in changes.added:
+            fire(EVENT_BORROWING_ADDED, _event_data(entry_id, borrowing))
+        for borrowing in changes.removed:
+            fire(EVENT_BORROWING_REMOVED, _event_data(entry_id, borrowing))
+        for before, borrowing in changes.renewed:
+            fire(
+                EVENT_BORROWING_RENEWED,
+                _event_data(entry_id, borrowing)
+                | {"previous_expiration": before.expiration.isoformat()},
+            )
+
+
+def _event_data(entry_id: str | None, borrowing: TritiusBorrowing) -> dict[str, Any]:
+    """Build data of borrowing event."""
+    return {
+        "config_entry_id": entry_id,
+        "id": borrowing.id,
+        "title": borrowing.title,
+        "author": borrowing.author,
+        "expiration": borrowing.expiration.isoformat(),
+    }
+
+
+def _jittered(interval: timedelta) -> timedelta:
+    """Add random delay so accounts of one library do not update at once."""
+    return interval + timedelta(
+        seconds=random.uniform(0, UPDATE_JITTER.total_seconds())
+    )
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.loader import Integration
 
 from .api import TritiusApiClient, TritiusUser
 from .coordinator import TritiusDataUpdateCoordinator
+from .storage import TritiusStore
 
 type TritiusConfigEntry = ConfigEntry[TritiusData]
 
@@ -20,4 +21,7 @@ class TritiusData:
     client: TritiusApiClient
     coordinator: TritiusDataUpdateCoordinator
     integration: Integration
+    store: TritiusStore
     user: TritiusUser
+    # durations of setup phases in seconds
+    startup: dict[str, float] = field(default_factory=dict)
@@ -0,0 +1,30 @@
+"""Diagnostics support for tritius."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .data import TritiusConfigEntry
+from .parser import parser_backend
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,
+    entry: TritiusConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    return {
+        "entry": async_redact_data(entry.data, TO_REDACT),
+        "parser": {
+            "backend": parser_backend(),
+        },
+        "startup": entry.runtime_data.startup,
+        "page_timings": entry.runtime_data.coordinator.page_timings,
+        "metrics": entry.runtime_data.client.metrics.as_dict(),
+    }
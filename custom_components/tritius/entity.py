@@ -6,6 +6,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -23,6 +24,7 @@ class TritiusEntity(CoordinatorEntity[TritiusDataUpdateCoordinator]):
         # config_entry = data.integration.confi()
 
         super().__init__(coordinator)
+        self._written_state: tuple | None = None
         device_id = f"{data.user.url}_{data.user.id}"
         self._attr_unique_id = f"{device_id}_{suffix}"
         self._attr_has_entity_name = True
@@ -40,6 +42,20 @@ class TritiusEntity(CoordinatorEntity[TritiusDataUpdateCoordinator]):
             name=device_name,
         )
 
+    async def async_update(self) -> None:
+        """Update entity on demand, personal data are updated too."""
+        self.coordinator.request_user_refresh()
+        await super().async_update()
+
+    @callback
+    def _async_write_ha_state_if_changed(self, *state: Any) -> None:
+        """Write state only when values it is built from changed."""
+        state = (self.available, *state)
+        if state == self._written_state:
+            return
+        self._written_state = state
+        self.async_write_ha_state()
+
 
 @dataclass(frozen=True, kw_only=True)
 class TritiusEntityMixin:
@@ -47,3 +63,5 @@ class TritiusEntityMixin:
 
     value_fn: Callable[[TritiusCoordinatorData], Any]
     attr_fn: Callable[[TritiusCoordinatorData], Any] | None = None
+    # attributes are rebuilt only when data they are built from change
+    attr_source_fn: Callable[[TritiusCoordinatorData], Any] | None = None
@@ -0,0 +1,113 @@
+"""Request limits shared by all accounts of one library."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from .const import (
+    _LOGGER,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_OPEN_TIME,
+    CIRCUIT_OPEN_TIME,
+    MAX_CONCURRENT_REQUESTS,
+    REQUEST_BURST,
+    REQUEST_RATE,
+)
+
+
+class TritiusHost:
+    """Concurrency limit, rate limiter and circuit breaker for library server.
+
+    After consecutive failures the circuit opens and requests are refused for
+    open time, which doubles with every failure of trial request after it.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+        rate: float = REQUEST_RATE,
+        burst: int = REQUEST_BURST,
+    ) -> None:
+        """Initialize."""
+        self.url = url
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._failures = 0
+        self._open_time = CIRCUIT_OPEN_TIME
+        self._opened_until: float | None = None
+
+    @property
+    def retry_after(self) -> float | None:
+        """Seconds until requests are allowed, None when circuit is not open."""
+        if self._opened_until is None:
+            return None
+        remaining = self._opened_until - time.monotonic()
+        return remaining if remaining > 0 else None
+
+    def record_success(self) -> None:
+        """Close circuit after server responded."""
+        if self._opened_until is not None:
+            _LOGGER.info("Library %s is responding again", self.url)
+        self._failures = 0
+        self._open_time = CIRCUIT_OPEN_TIME
+        self._opened_until = None
+
+    def record_failure(self) -> None:
+        """Count failure, open circuit when threshold is reached."""
+        self._failures += 1
+        if self._failures < CIRCUIT_FAILURE_THRESHOLD:
+            return
+        _LOGGER.warning(
+            "Library %s is not responding, pausing requests for %ss",
+            self.url,
+            self._open_time,
+        )
+        self._opened_until = time.monotonic() + self._open_time
+        self._open_time = min(self._open_time * 2, CIRCUIT_MAX_OPEN_TIME)
+
+    async def _async_take_token(self) -> None:
+        """Wait until request is allowed by rate limit."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            delay = (1 - self._tokens) / self._rate
+            _LOGGER.debug("Rate limit of %s reached, waiting %.2fs", self.url, delay)
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def limit(self) -> AsyncIterator[None]:
+        """Run request within limits of host."""
+        async with self._semaphore:
+            await self._async_take_token()
+            yield
+
+
+_HOSTS: dict[str, TritiusHost] = {}
+
+
+def get_host(url: str) -> TritiusHost:
+    """Get limits shared by connections to normalized library url.
+
+    Default limits are used unless other ones were registered for url.
+    """
+    if (host := _HOSTS.get(url)) is None:
+        host = _HOSTS[url] = TritiusHost(url)
+    return host
+
+
+def register_host(host: TritiusHost) -> None:
+    """Register limits of library, replacing current ones."""
+    _HOSTS[host.url] = host
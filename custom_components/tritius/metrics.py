@@ -0,0 +1,82 @@
+"""Request and parsing instrumentation of tritius client."""
+
+from __future__ import annotations
+
+import bisect
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import DURATION_BUCKETS
+
+
+@dataclass
+class TritiusHistogram:
+    """Counts of durations in buckets bounded by seconds."""
+
+    bounds: tuple[float, ...] = DURATION_BUCKETS
+    counts: list[int] = field(init=False)
+    count: int = 0
+    total: float = 0.0
+    last: float | None = None
+
+    def __post_init__(self) -> None:
+        """Initialize buckets, last one is unbounded."""
+        self.counts = [0] * (len(self.bounds) + 1)
+
+    @property
+    def mean(self) -> float | None:
+        """Mean of observed durations."""
+        return self.total / self.count if self.count else None
+
+    def observe(self, seconds: float) -> None:
+        """Count duration in its bucket."""
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Histogram as json serializable dict."""
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            "count": self.count,
+            "mean": None if self.mean is None else round(self.mean, 4),
+            "last": None if self.last is None else round(self.last, 4),
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+@dataclass
+class TritiusMetrics:
+    """Counters and durations of requests, parsing and refreshes of account."""
+
+    requests: Counter[str] = field(default_factory=Counter)
+    errors: Counter[str] = field(default_factory=Counter)
+    logins: int = 0
+    bytes_received: int = 0
+    request_latency: TritiusHistogram = field(default_factory=TritiusHistogram)
+    # last parse time by page
+    parse_time: dict[str, float] = field(default_factory=dict)
+    parse_latency: TritiusHistogram = field(default_factory=TritiusHistogram)
+    refresh_duration: TritiusHistogram = field(default_factory=TritiusHistogram)
+
+    def observe_parse(self, page: str, seconds: float) -> None:
+        """Record parse time of page."""
+        self.parse_time[page] = seconds
+        self.parse_latency.observe(seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Metrics as json serializable dict."""
+        return {
+            "requests": dict(self.requests),
+            "errors": dict(self.errors),
+            "logins": self.logins,
+            "bytes_received": self.bytes_received,
+            "request_latency": self.request_latency.as_dict(),
+            "parse_time": {
+                page: round(seconds, 4) for page, seconds in self.parse_time.items()
+            },
+            "parse_latency": self.parse_latency.as_dict(),
+            "refresh_duration": self.refresh_duration.as_dict(),
+        }
@@ -0,0 +1,230 @@
+"""Html parser backend for tritius.
+
+Parser stack is imported on first use, load_parser imports it ahead of time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import hashlib
+import re
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from typing import TYPE_CHECKING
+
+from .const import _LOGGER, PARSE_WORKERS, Selector, Url
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+# Tree builders in order of preference, C based parsers first.
+PARSER_BACKENDS: tuple[str, ...] = ("lxml", "html.parser")
+
+
+@functools.cache
+def parser_backend() -> str:
+    """Detect fastest installed tree builder."""
+    from bs4.builder import builder_registry  # noqa: PLC0415
+
+    backend = next(
+        (x for x in PARSER_BACKENDS if builder_registry.lookup(x) is not None),
+        PARSER_BACKENDS[-1],
+    )
+    _LOGGER.debug("Using html parser backend %s", backend)
+    return backend
+
+
+def load_parser() -> str:
+    """Import parser stack and prepare strainers, blocks while importing."""
+    _strainers()
+    return parser_backend()
+
+
+def _class(name: str) -> re.Pattern[str]:
+    """Match one class in raw class attribute."""
+    return re.compile(rf"(^|\s){re.escape(name)}(\s|$)")
+
+
+# Ids of subtrees containing the selected elements.
+_SUBTREE_IDS: dict[Selector, str] = {
+    Selector.REGISTRATION_EXPIRATION: "navbar",
+    Selector.PORTLET_PERSONAL_DATA: "portlet-personal-data",
+    Selector.PORTLET_BORROWINGS: "borrowings-portlet",
+}
+
+
+@functools.cache
+def _strainers() -> dict[Selector, SoupStrainer]:
+    """Strainers for selected elements not placed in subtree with id."""
+    from bs4 import SoupStrainer  # noqa: PLC0415
+
+    return {
+        Selector.LOGIN_FORM: SoupStrainer("form", class_=_class("login-form")),
+        Selector.FLASH_ALERT: SoupStrainer("div", class_=_class("flash-messages")),
+        Selector.RENEW_ALL_FORM: SoupStrainer("form", action=f"/{Url.RENEW_ALL}"),
+    }
+
+
+# Text which must be present in page when selected element exists.
+_MARKERS: dict[Selector, str] = {
+    Selector.LOGIN_FORM: "login-form",
+    Selector.FLASH_ALERT: "alert-danger",
+}
+
+
+def _strainer(only: tuple[Selector, ...]) -> SoupStrainer | None:
+    """Create strainer parsing only subtrees of selectors."""
+    from bs4 import SoupStrainer  # noqa: PLC0415
+
+    if not only:
+        return None
+    if all(selector in _SUBTREE_IDS for selector in only):
+        return SoupStrainer(id=[_SUBTREE_IDS[selector] for selector in only])
+    if len(only) == 1 and only[0] in _strainers():
+        return _strainers()[only[0]]
+    _LOGGER.debug("No strainer for %s, parsing whole page", only)
+    return None
+
+
+def parse_html(text: str, only: Iterable[Selector] = ()) -> BeautifulSoup:
+    """Parse html page, when selectors are given only their subtrees."""
+    from bs4 import BeautifulSoup  # noqa: PLC0415
+
+    return BeautifulSoup(text, parser_backend(), parse_only=_strainer(tuple(only)))
+
+
+def find_in_html(text: str, selector: Selector) -> Tag | None:
+    """Find element in html page parsing as little as possible."""
+    marker = _MARKERS.get(selector)
+    if marker is not None and marker not in text:
+        return None
+    return parse_html(text, (selector,)).select_one(selector)
+
+
+class _SubtreeFound(Exception):
+    """Raised by subtree finder to stop tokenizing at end of subtree."""
+
+
+class _SubtreeFinder(HTMLParser):
+    """Find positions of element with id by tokenizing, no tree is built.
+
+    Comments, contents of scripts and attribute values are skipped by tokenizer,
+    so they cannot end the element early.
+    """
+
+    def __init__(self, element_id: str) -> None:
+        """Initialize."""
+        super().__init__(convert_charrefs=False)
+        self._element_id = element_id
+        self._tag: str | None = None
+        self._depth = 0
+        self.start: tuple[int, int] | None = None
+        self.end: tuple[int, int] | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Count nested tags of element, start it on tag with id."""
+        if self._tag is None:
+            if ("id", self._element_id) in attrs:
+                self._tag = tag
+                self._depth = 1
+                self.start = self.getpos()
+        elif tag == self._tag:
+            self._depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        """Stop on end tag closing element."""
+        if tag != self._tag:
+            return
+        self._depth -= 1
+        if self._depth == 0:
+            self.end = self.getpos()
+            raise _SubtreeFound
+
+
+def _offset(text: str, position: tuple[int, int]) -> int:
+    """Offset in text of line and column reported by tokenizer."""
+    line, column = position
+    offset = 0
+    for _ in range(line - 1):
+        offset = text.index("\n", offset) + 1
+    return offset + column
+
+
+def _extract_subtree(text: str, element_id: str) -> str | None:
+    """Extract html of element with id, None when it is missing or unclosed."""
+    finder = _SubtreeFinder(element_id)
+    with contextlib.suppress(_SubtreeFound):
+        finder.feed(text)
+    if finder.start is None or finder.end is None:
+        return None
+    end = _offset(text, finder.end)
+    return text[_offset(text, finder.start) : text.find(">", end) + 1]
+
+
+def content_digest(text: str, only: Iterable[Selector]) -> str | None:
+    """Digest of subtrees of selectors, None when it cannot be extracted.
+
+    Subtrees are found by text scanning, so no tree is built.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for selector in only:
+        if (element_id := _SUBTREE_IDS.get(selector)) is None:
+            return None
+        if (subtree := _extract_subtree(text, element_id)) is None:
+            return None
+        digest.update(subtree.encode())
+    return digest.hexdigest()
+
+
+class TritiusParseExecutor:
+    """Bounded thread pool parsing pages outside of event loop."""
+
+    def __init__(self, workers: int = PARSE_WORKERS) -> None:
+        """Initialize, threads are started on first use."""
+        self._workers = workers
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def workers(self) -> int:
+        """Count of parsing threads."""
+        return self._workers
+
+    def set_workers(self, workers: int) -> None:
+        """Change count of parsing threads, running parsing is finished."""
+        if workers == self._workers:
+            return
+        self.shutdown()
+        self._workers = workers
+
+    def shutdown(self) -> None:
+        """Stop parsing threads, they are started again on next use."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def async_run[T](self, func: Callable[..., T], *args) -> T:
+        """Run parsing function in thread pool, in event loop without workers."""
+        if self._workers <= 0:
+            return func(*args)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._workers, thread_name_prefix="tritius_parse"
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, func, *args
+        )
+
+
+# shared by all accounts, parsing is bounded for whole integration
+PARSE_EXECUTOR = TritiusParseExecutor()
+
+
+async def async_find_in_html(text: str, selector: Selector) -> Tag | None:
+    """Find element in html page, parsing in parse executor."""
+    marker = _MARKERS.get(selector)
+    if marker is not None and marker not in text:
+        return None
+    return await PARSE_EXECUTOR.async_run(find_in_html, text, selector)
@@ -2,18 +2,42 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .api import TritiusUser
+from .api import TritiusBorrowings, TritiusUser
 from .data import (
     TritiusConfigEntry,
     TritiusData,
 )
 from .entity import TritiusEntity, TritiusEntityMixin
+from .metrics import TritiusMetrics
+
+
+def _borrowings_attr(borrowings: TritiusBorrowings | None) -> dict[str, Any]:
+    """Borrowings as plain values, ready for serialization."""
+    return {
+        "borrowings": [
+            {
+                "author": borrowing.author,
+                "title": borrowing.title,
+                "id": borrowing.id,
+                "expiration": borrowing.expiration.isoformat(),
+            }
+            for borrowing in borrowings or []
+        ]
+    }
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -27,7 +51,8 @@ ENTITY_DESCRIPTIONS: tuple[TritiusSensorEntityDescription, ...] = (
         translation_key="borrowings",
         icon="mdi:book-open-variant-outline",
         value_fn=lambda x: 0 if x.borrowings is None else len(x.borrowings),
-        attr_fn=lambda x: {"borrowings": x.borrowings or []},
+        attr_fn=lambda x: _borrowings_attr(x.borrowings),
+        attr_source_fn=lambda x: x.borrowings,
     ),
     TritiusSensorEntityDescription(
         key="registration_expiration",
@@ -46,6 +71,59 @@ ENTITY_DESCRIPTIONS: tuple[TritiusSensorEntityDescription, ...] = (
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class TritiusMetricSensorEntityDescription(SensorEntityDescription):
+    """Diagnostic sensor description with expression over client metrics."""
+
+    value_fn: Callable[[TritiusMetrics], Any]
+    entity_category: EntityCategory | None = EntityCategory.DIAGNOSTIC
+    entity_registry_enabled_default: bool = False
+
+
+METRIC_DESCRIPTIONS: tuple[TritiusMetricSensorEntityDescription, ...] = (
+    TritiusMetricSensorEntityDescription(
+        key="requests",
+        translation_key="requests",
+        icon="mdi:web",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda x: x.requests.total(),
+    ),
+    TritiusMetricSensorEntityDescription(
+        key="logins",
+        translation_key="logins",
+        icon="mdi:login",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda x: x.logins,
+    ),
+    TritiusMetricSensorEntityDescription(
+        key="bytes_received",
+        translation_key="bytes_received",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda x: x.bytes_received,
+    ),
+    TritiusMetricSensorEntityDescription(
+        key="request_latency",
+        translation_key="request_latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=3,
+        value_fn=lambda x: x.request_latency.last,
+    ),
+    TritiusMetricSensorEntityDescription(
+        key="refresh_duration",
+        translation_key="refresh_duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=3,
+        value_fn=lambda x: x.refresh_duration.last,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: TritiusConfigEntry,
@@ -59,6 +137,13 @@ async def async_setup_entry(
         )
         for entity_description in ENTITY_DESCRIPTIONS
     )
+    async_add_entities(
+        TritiusMetricSensor(
+            data=entry.runtime_data,
+            entity_description=entity_description,
+        )
+        for entity_description in METRIC_DESCRIPTIONS
+    )
 
 
 class TritiusSensor(TritiusEntity, SensorEntity):
@@ -74,14 +159,57 @@ class TritiusSensor(TritiusEntity, SensorEntity):
         """Initialize the sensor class."""
         super().__init__(data, entity_description.key)
         self.entity_description = entity_description
+        self._attr_extra_state_attributes = None
+        self._attr_source: Any = None
 
     @callback
     def _handle_coordinator_update(self):
-        self._attr_native_value = self.entity_description.value_fn(
-            self.coordinator.data
-        )
-        if self.entity_description.attr_fn is not None:
-            self._attr_extra_state_attributes = self.entity_description.attr_fn(
-                self.coordinator.data
+        data = self.coordinator.data
+        description = self.entity_description
+        self._attr_native_value = description.value_fn(data)
+        if description.attr_fn is not None:
+            source = (
+                data
+                if description.attr_source_fn is None
+                else description.attr_source_fn(data)
             )
-        super().async_write_ha_state()
+            if (
+                self._attr_extra_state_attributes is None
+                or source is not self._attr_source
+                and source != self._attr_source
+            ):
+                self._attr_source = source
+                self._attr_extra_state_attributes = description.attr_fn(data)
+        self._async_write_ha_state_if_changed(
+            self._attr_native_value, self._attr_extra_state_attributes
+        )
+
+
+class TritiusMetricSensor(TritiusEntity, SensorEntity):
+    """Tritius diagnostic sensor of client metrics."""
+
+    entity_description: TritiusMetricSensorEntityDescription
+
+    def __init__(
+        self,
+        data: TritiusData,
+        entity_description: TritiusMetricSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(data, entity_description.key)
+        self.entity_description = entity_description
+        self._metrics = data.client.metrics
+
+    @property
+    def should_poll(self) -> bool:
+        """Poll metrics, they change with requests not only with data."""
+        return True
+
+    async def async_update(self) -> None:
+        """Read metrics without refreshing coordinator."""
+        self._attr_native_value = self.entity_description.value_fn(self._metrics)
+
+    @callback
+    def _handle_coordinator_update(self):
+        self._attr_native_value = self.entity_description.value_fn(self._metrics)
+        self._async_write_ha_state_if_changed(self._attr_native_value)
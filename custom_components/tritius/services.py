@@ -2,15 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import defaultdict
+from typing import Any
+
 import homeassistant.helpers.config_validation as cv
 import homeassistant.helpers.device_registry as dr
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import ATTR_DEVICE_ID
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import _LOGGER, DOMAIN, SERVICE_RENEW_BORROWINGS
+from .api import TritiusApiClientError
+from .const import (
+    _LOGGER,
+    ATTR_BORROWING_IDS,
+    DOMAIN,
+    MAX_CONCURRENT_SERVICE_HOSTS,
+    SERVICE_RENEW_BORROWINGS,
+)
 from .data import TritiusConfigEntry
 
 
@@ -21,8 +37,8 @@ async def async_setup_services(
 
     async def collect_entries(
         device_ids: list[str],
-    ) -> list[TritiusConfigEntry]:
-        config_entries = list[TritiusConfigEntry]()
+    ) -> list[tuple[str, TritiusConfigEntry]]:
+        config_entries = list[tuple[str, TritiusConfigEntry]]()
         registry = dr.async_get(hass)
         for target in device_ids:
             device = registry.async_get(target)
@@ -36,24 +52,69 @@ async def async_setup_services(
                     raise HomeAssistantError(
                         f"Device '{target}' is not a {DOMAIN} device"
                     )
-                config_entries.extend(device_entries)
+                config_entries.extend((target, entry) for entry in device_entries)
             else:
                 raise HomeAssistantError(
                     f"Device '{target}' not found in device registry"
                 )
-        entries = list[TritiusConfigEntry]()
-        for config_entry in config_entries:
+        entries = list[tuple[str, TritiusConfigEntry]]()
+        for device_id, config_entry in config_entries:
             if config_entry.state != ConfigEntryState.LOADED:
                 raise HomeAssistantError(f"{config_entry.title} is not loaded")
-            entries.append(config_entry)
+            entries.append((device_id, config_entry))
         return entries
 
-    async def async_renew_borrowings(call: ServiceCall) -> None:
-        """Renew borrowings."""
-        for config_entry in await collect_entries(call.data[ATTR_DEVICE_ID]):
-            _LOGGER.debug("Renew service called for %s", ATTR_DEVICE_ID)
-            await config_entry.runtime_data.client.async_renew_borrowings()
-            await config_entry.runtime_data.coordinator.async_request_refresh()
+    async def async_renew_entry(
+        device_id: str,
+        config_entry: TritiusConfigEntry,
+        borrowing_ids: list[int] | None,
+    ) -> dict[str, Any]:
+        """Renew borrowings of one entry, failure is part of result.
+
+        Only borrowings with ids are renewed when given, all otherwise.
+        """
+        _LOGGER.debug("Renew service called for %s", device_id)
+        client = config_entry.runtime_data.client
+        result: dict[str, Any] = {"device_id": device_id, "name": config_entry.title}
+        try:
+            if borrowing_ids is None:
+                result["renewed"] = await client.async_renew_borrowings()
+            else:
+                renewed = await client.async_renew_borrowing_ids(borrowing_ids)
+                result["renewed"] = any(renewed.values())
+                result["renewed_ids"] = [x for x, ok in renewed.items() if ok]
+        except (TritiusApiClientError, HomeAssistantError) as exception:
+            _LOGGER.warning(
+                "Unable to renew borrowings of %s: %s", config_entry.title, exception
+            )
+            result["error"] = str(exception)
+            return result
+        await config_entry.runtime_data.coordinator.async_request_refresh()
+        return result
+
+    async def async_renew_host(
+        semaphore: asyncio.Semaphore,
+        entries: list[tuple[str, TritiusConfigEntry]],
+        borrowing_ids: list[int] | None,
+    ) -> list[dict[str, Any]]:
+        """Renew entries of one library one by one."""
+        async with semaphore:
+            return [await async_renew_entry(*entry, borrowing_ids) for entry in entries]
+
+    async def async_renew_borrowings(call: ServiceCall) -> ServiceResponse:
+        """Renew borrowings, libraries are processed concurrently."""
+        hosts = defaultdict[str, list[tuple[str, TritiusConfigEntry]]](list)
+        for device_id, config_entry in await collect_entries(call.data[ATTR_DEVICE_ID]):
+            hosts[config_entry.runtime_data.user.url].append((device_id, config_entry))
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SERVICE_HOSTS)
+        results = await asyncio.gather(
+            *(
+                async_renew_host(semaphore, entries, call.data.get(ATTR_BORROWING_IDS))
+                for entries in hosts.values()
+            )
+        )
+        return {"results": [result for host in results for result in host]}
 
     hass.services.async_register(
         DOMAIN,
@@ -63,7 +124,11 @@ async def async_setup_services(
             vol.All(
                 {
                     vol.Required(ATTR_DEVICE_ID): cv.ensure_list,
+                    vol.Optional(ATTR_BORROWING_IDS): vol.All(
+                        cv.ensure_list, [vol.Coerce(int)]
+                    ),
                 }
             )
         ),
+        supports_response=SupportsResponse.OPTIONAL,
     )
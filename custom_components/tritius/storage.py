@@ -0,0 +1,134 @@
+"""Persistent storage for tritius."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .api import TritiusBorrowing, TritiusBorrowings, TritiusUser
+from .const import _LOGGER, DOMAIN
+from .coordinator import TritiusCoordinatorData
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+
+class TritiusStore:
+    """Data of config entry kept between restarts."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize."""
+        self._store = Store[dict[str, Any]](
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._data: dict[str, Any] = {}
+
+    async def async_load(self) -> None:
+        """Load stored data."""
+        self._data = await self._store.async_load() or {}
+
+    async def async_remove(self) -> None:
+        """Remove stored data."""
+        await self._store.async_remove()
+
+    @property
+    def cookies(self) -> dict[str, str]:
+        """Stored session cookies."""
+        return self._data.get("cookies", {})
+
+    @callback
+    def async_set_cookies(self, cookies: dict[str, str]) -> None:
+        """Store session cookies when changed."""
+        if cookies == self.cookies:
+            return
+        _LOGGER.debug("Session cookies changed, storing")
+        self._data["cookies"] = cookies
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
+
+    @property
+    def snapshot(self) -> TritiusCoordinatorData | None:
+        """Data of last update, None when missing or unreadable."""
+        if (snapshot := self._data.get("snapshot")) is None:
+            return None
+        try:
+            return _snapshot_from_dict(snapshot)
+        except (KeyError, TypeError, ValueError) as exception:
+            _LOGGER.debug("Ignoring stored snapshot: %s", exception)
+            return None
+
+    @callback
+    def async_set_snapshot(self, data: TritiusCoordinatorData) -> None:
+        """Store data of last update when changed."""
+        snapshot = _snapshot_to_dict(data)
+        if snapshot == self._data.get("snapshot"):
+            return
+        self._data["snapshot"] = snapshot
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
+
+
+def _date_from_str(value: str | None) -> date | None:
+    """Parse optional iso date."""
+    return None if value is None else date.fromisoformat(value)
+
+
+def _snapshot_to_dict(data: TritiusCoordinatorData) -> dict[str, Any]:
+    """Convert coordinator data to json serializable dict."""
+    user = data.user
+    return {
+        "user": None
+        if user is None
+        else {
+            "url": user.url,
+            "id": user.id,
+            "name": user.name,
+            "surname": user.surname,
+            "registration_expiration": None
+            if user.registration_expiration is None
+            else user.registration_expiration.isoformat(),
+        },
+        "borrowings": None
+        if data.borrowings is None
+        else [
+            {
+                "author": borrowing.author,
+                "title": borrowing.title,
+                "id": borrowing.id,
+                "expiration": borrowing.expiration.isoformat(),
+            }
+            for borrowing in data.borrowings
+        ],
+    }
+
+
+def _snapshot_from_dict(snapshot: dict[str, Any]) -> TritiusCoordinatorData:
+    """Convert stored dict to coordinator data of today."""
+    user = snapshot["user"]
+    borrowings = snapshot["borrowings"]
+    if borrowings is not None:
+        borrowings = TritiusBorrowings(
+            TritiusBorrowing(
+                author=borrowing["author"],
+                title=borrowing["title"],
+                id=borrowing["id"],
+                expiration=date.fromisoformat(borrowing["expiration"]),
+            )
+            for borrowing in borrowings
+        )
+    return TritiusCoordinatorData(
+        user=None
+        if user is None
+        else TritiusUser(
+            url=user["url"],
+            id=user["id"],
+            name=user["name"],
+            surname=user["surname"],
+            registration_expiration=_date_from_str(user["registration_expiration"]),
+        ),
+        borrowings=borrowings,
+        borrowing_expiration=None
+        if borrowings is None
+        else borrowings.nearest_expiration,
+    )
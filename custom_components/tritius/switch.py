@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from collections.abc import Mapping
 from datetime import date
 from typing import Any
@@ -13,11 +14,13 @@ from homeassistant.components.switch import (
 )
 from homeassistant.const import STATE_ON
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import dt as dt_util
 
-from .api import TritiusApiClient, TritiusApiClientError
-from .const import _LOGGER
+from .api import TritiusApiClient, TritiusApiClientError, TritiusBorrowings
+from .const import _LOGGER, ALERT_DELTA
 from .data import (
     TritiusConfigEntry,
     TritiusData,
@@ -53,6 +56,9 @@ class TritiusSwitchSensor(TritiusEntity, RestoreEntity, SwitchEntity):
 
     entity_description: SwitchEntityDescription
     _last_run: date | None
+    _last_result: str | None
+    _last_duration: float | None
+    _renew_task: asyncio.Task | None
     _client: TritiusApiClient
 
     def __init__(
@@ -64,6 +70,9 @@ class TritiusSwitchSensor(TritiusEntity, RestoreEntity, SwitchEntity):
         super().__init__(data, entity_description.key)
         self._client = data.client
         self._last_run = None
+        self._last_result = None
+        self._last_duration = None
+        self._renew_task = None
         self._state = False
         self.entity_description = entity_description
 
@@ -77,6 +86,14 @@ class TritiusSwitchSensor(TritiusEntity, RestoreEntity, SwitchEntity):
         _LOGGER.debug("Last state %s", last_state.state)
         self._state = last_state.state == STATE_ON
         self._last_run = last_state.attributes.get("last_run")
+        self._last_result = last_state.attributes.get("last_result")
+        self._last_duration = last_state.attributes.get("last_duration")
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel running renew when removed."""
+        await super().async_will_remove_from_hass()
+        if self._renew_task is not None:
+            self._renew_task.cancel()
 
     @property
     def is_on(self) -> bool | None:
@@ -84,8 +101,9 @@ class TritiusSwitchSensor(TritiusEntity, RestoreEntity, SwitchEntity):
         return self._state
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on the switch."""
+        """Turn on the switch, renew right away when alert is already on."""
         self._state = True
+        self._async_start_renew()
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
@@ -96,12 +114,21 @@ class TritiusSwitchSensor(TritiusEntity, RestoreEntity, SwitchEntity):
     @property
     def extra_state_attributes(self) -> Mapping[Any, Any]:
         """Return the state attributes."""
-        return {"last_run": self._last_run}
+        return {
+            "last_run": self._last_run,
+            "last_result": self._last_result,
+            "last_duration": self._last_duration,
+        }
 
     @callback
     def _handle_coordinator_update(self):
-        now = date.today()
-        result = False
+        self._async_start_renew()
+        self._async_write_ha_state_if_changed(self._last_run)
+
+    @callback
+    def _async_start_renew(self) -> None:
+        """Start renewal when alert is on, at most once a day."""
+        now = dt_util.now().date()
 
         # Run update only once a day
         if (
@@ -109,17 +136,31 @@ class TritiusSwitchSensor(TritiusEntity, RestoreEntity, SwitchEntity):
             and self._last_run != now
             and self._state
         ):
-            try:
-                result = asyncio.run_coroutine_threadsafe(
-                    self._client.async_renew_borrowings(),
-                    self.hass.loop,
-                ).result()
-            except TritiusApiClientError as ex:
-                _LOGGER.debug("Unable to renew borrowings %s", ex)
+            if self._renew_task is not None and not self._renew_task.done():
+                _LOGGER.debug("Renew already in progress")
             else:
-                if result:
-                    self.hass.async_create_task(
-                        self.coordinator.async_request_refresh()
-                    )
-            finally:
                 self._last_run = now
+                self._renew_task = self.hass.async_create_background_task(
+                    self._async_renew(), f"{self.entity_id} auto renew"
+                )
+
+    async def _async_renew(self) -> None:
+        """Renew borrowings due to expire and refresh coordinator when renewed."""
+        start = time.monotonic()
+        borrowings = self.coordinator.data.borrowings or TritiusBorrowings()
+        due = [
+            borrowing.id
+            for borrowing in borrowings.expiring(dt_util.now().date() + ALERT_DELTA)
+        ]
+        try:
+            renewed = await self._client.async_renew_borrowing_ids(due)
+            result = any(renewed.values())
+        except (TritiusApiClientError, HomeAssistantError) as ex:
+            _LOGGER.debug("Unable to renew borrowings %s", ex)
+            self._last_result = "failed"
+        else:
+            self._last_result = "renewed" if result else "nothing_to_renew"
+            if result:
+                await self.coordinator.async_request_refresh()
+        self._last_duration = round(time.monotonic() - start, 3)
+        self.async_write_ha_state()
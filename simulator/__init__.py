@@ -0,0 +1 @@
+"""Local tritius simulator for load and latency testing."""
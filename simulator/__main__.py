@@ -0,0 +1,114 @@
+"""Run tritius simulator or load driver against it.
+
+Usage:
+    scripts/simulate serve [--port PORT] [--accounts N] [--latency S] ...
+    scripts/simulate load [--url URL] [--accounts N] [--rounds R] ...
+
+Accounts are named reader0, reader1, ... with password secret. Load without
+url starts simulator in the same process and reports its request counters.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+from .load import LoadConfig, async_run_load, report
+from .server import Simulator, SimulatorConfig, async_start
+
+
+def _simulator_config(args: argparse.Namespace) -> SimulatorConfig:
+    return SimulatorConfig(
+        accounts=args.accounts,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        application_error_rate=args.application_error_rate,
+        page_size=args.page_size,
+        seed=args.seed,
+    )
+
+
+async def _async_serve(args: argparse.Namespace) -> None:
+    simulator = Simulator(_simulator_config(args))
+    runner, url = await async_start(simulator, args.host, args.port)
+    sys.stdout.write(f"Simulator of {args.accounts} accounts running at {url}\n")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+async def _async_load(args: argparse.Namespace) -> None:
+    runner = simulator = None
+    url = args.url
+    if url is None:
+        simulator = Simulator(_simulator_config(args))
+        runner, url = await async_start(simulator)
+    config = LoadConfig(
+        url=url,
+        accounts=args.accounts,
+        rounds=args.rounds,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        burst=args.burst,
+        connections=args.connections,
+    )
+    try:
+        results = await async_run_load(config)
+    finally:
+        if runner is not None:
+            await runner.cleanup()
+    report(config, results)
+    if simulator is not None:
+        elapsed = sum(result.elapsed for result in results)
+        total = sum(simulator.stats.requests.values())
+        sys.stdout.write(f"requests/s: {total / elapsed:.1f}\n")
+        sys.stdout.write(json.dumps(simulator.stats.as_dict(), indent=2) + "\n")
+
+
+def main() -> int:
+    """Parse arguments and run command."""
+    parser = argparse.ArgumentParser(
+        prog="simulate",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--verbose", action="store_true")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="run simulator")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8480)
+    load = commands.add_parser("load", help="run coordinators against simulator")
+    load.add_argument("--url", help="simulator url, started locally when omitted")
+    load.add_argument("--rounds", type=int, default=3)
+    load.add_argument("--concurrency", type=int, default=2, help="per library")
+    load.add_argument("--rate", type=float, default=2.0, help="requests/s")
+    load.add_argument("--burst", type=int, default=5)
+    load.add_argument("--connections", type=int, default=100)
+
+    for command, accounts in ((serve, 5000), (load, 100)):
+        command.add_argument("--accounts", type=int, default=accounts)
+        command.add_argument("--latency", type=float, default=0.1, help="seconds")
+        command.add_argument("--jitter", type=float, default=0.05, help="seconds")
+        command.add_argument("--error-rate", type=float, default=0.0)
+        command.add_argument("--application-error-rate", type=float, default=0.0)
+        command.add_argument("--page-size", type=int, default=0, help="borrowings")
+        command.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    if not args.verbose:
+        # failed refreshes are counted in report
+        logging.getLogger("tritius").setLevel(logging.CRITICAL)
+
+    asyncio.run(_async_serve(args) if args.command == "serve" else _async_load(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Load driver running many coordinators against simulator."""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from tritius.api import TritiusApiClient
+from tritius.coordinator import TritiusDataUpdateCoordinator
+from tritius.host import TritiusHost, register_host
+
+from .server import PASSWORD
+
+
+@dataclass
+class LoadConfig:
+    """Parameters of load run."""
+
+    url: str
+    accounts: int = 100
+    rounds: int = 3
+    concurrency: int = 2
+    rate: float = 2.0
+    burst: int = 5
+    connections: int = 100
+
+
+@dataclass
+class RoundResult:
+    """Measured values of one round refreshing all coordinators."""
+
+    elapsed: float
+    refresh_p50: float
+    refresh_p95: float
+    failures: int
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    """Percentile of values."""
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100)[percent - 1]
+
+
+async def _async_timed_refresh(coordinator: TritiusDataUpdateCoordinator) -> float:
+    """Refresh coordinator and return its duration."""
+    start = time.monotonic()
+    await coordinator.async_refresh()
+    return time.monotonic() - start
+
+
+async def async_run_load(config: LoadConfig) -> list[RoundResult]:
+    """Refresh coordinators of all accounts in rounds."""
+    register_host(
+        TritiusHost(
+            config.url, config.concurrency, rate=config.rate, burst=config.burst
+        )
+    )
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        connector = aiohttp.TCPConnector(limit=config.connections)
+        # separate cookie jars over one connection pool, as in Home Assistant
+        sessions = [
+            aiohttp.ClientSession(
+                connector=connector,
+                connector_owner=False,
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+            )
+            for _ in range(config.accounts)
+        ]
+        coordinators = [
+            TritiusDataUpdateCoordinator(
+                hass,
+                # every round downloads pages again, as hourly updates do
+                TritiusApiClient(
+                    config.url,
+                    f"reader{number}",
+                    PASSWORD,
+                    session,
+                    page_cache_ttl=0,
+                ),
+            )
+            for number, session in enumerate(sessions)
+        ]
+
+        results: list[RoundResult] = []
+        try:
+            for _ in range(config.rounds):
+                start = time.monotonic()
+                durations = await asyncio.gather(
+                    *(_async_timed_refresh(coordinator) for coordinator in coordinators)
+                )
+                results.append(
+                    RoundResult(
+                        time.monotonic() - start,
+                        _percentile(durations, 50),
+                        _percentile(durations, 95),
+                        sum(not c.last_update_success for c in coordinators),
+                    )
+                )
+        finally:
+            for session in sessions:
+                await session.close()
+            await connector.close()
+            await hass.async_stop(force=True)
+    return results
+
+
+def report(config: LoadConfig, results: list[RoundResult]) -> None:
+    """Write throughput of rounds."""
+    sys.stdout.write(
+        f"{'round':>5}{'elapsed s':>11}{'refresh/s':>11}"
+        f"{'p50 s':>9}{'p95 s':>9}{'failed':>8}\n"
+    )
+    for number, result in enumerate(results, 1):
+        sys.stdout.write(
+            f"{number:>5}{result.elapsed:>11.2f}"
+            f"{config.accounts / result.elapsed:>11.1f}"
+            f"{result.refresh_p50:>9.2f}{result.refresh_p95:>9.2f}"
+            f"{result.failures:>8}\n"
+        )
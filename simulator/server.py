@@ -0,0 +1,225 @@
+"""Simulated tritius library server with synthetic accounts."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import secrets
+from collections import Counter
+from dataclasses import dataclass, field
+
+from aiohttp import web
+
+from benchmarks import pages
+
+SESSION_COOKIE = "JSESSIONID"
+PASSWORD = "secret"
+# Days added to expiration of borrowings by renewal.
+RENEW_DAYS = 14
+
+
+@dataclass
+class SimulatorConfig:
+    """Behaviour of simulator."""
+
+    accounts: int = 1000
+    latency: float = 0.1
+    jitter: float = 0.05
+    error_rate: float = 0.0
+    application_error_rate: float = 0.0
+    # borrowings per page, all on one page when zero
+    page_size: int = 0
+    seed: int = 0
+
+
+@dataclass
+class Account:
+    """Synthetic account, username is reader followed by number."""
+
+    number: int
+    borrowings: int
+    extension: int = 0
+    # days added to single borrowings by their ids
+    extensions: dict[int, int] = field(default_factory=dict)
+
+
+@dataclass
+class Stats:
+    """Counters of served requests."""
+
+    requests: Counter[str] = field(default_factory=Counter)
+    errors: Counter[str] = field(default_factory=Counter)
+    logins: int = 0
+    renewals: int = 0
+    bytes_sent: int = 0
+
+    def as_dict(self) -> dict:
+        """Stats as json serializable dict."""
+        return {
+            "requests": dict(self.requests),
+            "errors": dict(self.errors),
+            "logins": self.logins,
+            "renewals": self.renewals,
+            "bytes_sent": self.bytes_sent,
+        }
+
+
+class Simulator:
+    """Tritius endpoints with session cookies, latency and error injection."""
+
+    def __init__(self, config: SimulatorConfig) -> None:
+        """Initialize."""
+        self.config = config
+        self.stats = Stats()
+        self._random = random.Random(config.seed)
+        self._sessions: dict[str, Account] = {}
+        self._accounts: dict[str, Account] = {}
+
+    def account(self, username: str) -> Account | None:
+        """Account of username, created on first use."""
+        if (account := self._accounts.get(username)) is not None:
+            return account
+        number = username.removeprefix("reader")
+        if not number.isdigit() or int(number) >= self.config.accounts:
+            return None
+        number = int(number)
+        # mostly small accounts, every hundredth one institutional
+        borrowings = 250 if number % 100 == 99 else number % 15
+        account = self._accounts[username] = Account(number, borrowings)
+        return account
+
+    def _session(self, request: web.Request) -> Account | None:
+        """Account logged in by session cookie."""
+        return self._sessions.get(request.cookies.get(SESSION_COOKIE, ""))
+
+    def _html(self, text: str) -> web.Response:
+        """Html response counted in stats."""
+        self.stats.bytes_sent += len(text.encode())
+        return web.Response(text=text, content_type="text/html")
+
+    @web.middleware
+    async def middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Delay response and inject server errors."""
+        if request.path == "/_stats":
+            return await handler(request)
+        self.stats.requests[request.path] += 1
+        delay = self.config.latency + self._random.uniform(0, self.config.jitter)
+        await asyncio.sleep(delay)
+        if self._random.random() < self.config.error_rate:
+            self.stats.errors[request.path] += 1
+            raise web.HTTPServiceUnavailable
+        return await handler(request)
+
+    async def root(self, request: web.Request) -> web.Response:
+        """Show home page."""
+        return await self.personal_data(request)
+
+    async def borrowings(self, request: web.Request) -> web.Response:
+        """Show current borrowings."""
+        if (account := self._session(request)) is None:
+            return self._html(pages.login_page())
+        page = request.query.get("page", "1")
+        return self._html(
+            pages.borrowings_page(
+                account.borrowings,
+                account.extension,
+                page=int(page) if page.isdigit() else 1,
+                page_size=self.config.page_size,
+                extensions=account.extensions,
+            )
+        )
+
+    async def personal_data(self, request: web.Request) -> web.Response:
+        """Show personal data."""
+        if (account := self._session(request)) is None:
+            return self._html(pages.login_page())
+        return self._html(
+            pages.personal_data_page(
+                f"315{account.number:08d}", "Reader", f"Number {account.number}"
+            )
+        )
+
+    async def login(self, request: web.Request) -> web.Response:
+        """Process login form."""
+        form = await request.post()
+        account = self.account(str(form.get("username", "")))
+        if account is None or form.get("password") != PASSWORD:
+            raise web.HTTPFound("/")
+        self.stats.logins += 1
+        session = secrets.token_hex(16)
+        self._sessions[session] = account
+        response = web.HTTPFound("/")
+        response.set_cookie(SESSION_COOKIE, session)
+        raise response
+
+    async def renew_all(self, request: web.Request) -> web.Response:
+        """Renew all borrowings and show them."""
+        if (account := self._session(request)) is None:
+            return self._html(pages.login_page())
+        if self._random.random() < self.config.application_error_rate:
+            self.stats.errors[request.path] += 1
+            return self._html(
+                pages.borrowings_page(
+                    account.borrowings,
+                    account.extension,
+                    "Renewal is not possible",
+                    page_size=self.config.page_size,
+                    extensions=account.extensions,
+                )
+            )
+        self.stats.renewals += 1
+        account.extension += RENEW_DAYS
+        raise web.HTTPFound("/profile/borrowings/current")
+
+    async def renew(self, request: web.Request) -> web.Response:
+        """Renew one borrowing and show borrowings."""
+        if (account := self._session(request)) is None:
+            return self._html(pages.login_page())
+        form = await request.post()
+        borrowing_id = str(form.get("id", ""))
+        if (
+            not borrowing_id.isdigit()
+            or not 1000 <= int(borrowing_id) < 1000 + account.borrowings
+            or self._random.random() < self.config.application_error_rate
+        ):
+            self.stats.errors[request.path] += 1
+            return self._html(
+                pages.borrowings_page(
+                    account.borrowings,
+                    account.extension,
+                    "Renewal is not possible",
+                    page_size=self.config.page_size,
+                    extensions=account.extensions,
+                )
+            )
+        self.stats.renewals += 1
+        account.extensions[int(borrowing_id)] = (
+            account.extensions.get(int(borrowing_id), 0) + RENEW_DAYS
+        )
+        raise web.HTTPFound("/profile/borrowings/current")
+
+    async def stats_view(self, request: web.Request) -> web.Response:
+        """Return served requests as json."""
+        return web.json_response(self.stats.as_dict())
+
+    def application(self) -> web.Application:
+        """Create aiohttp application of simulator."""
+        app = web.Application(middlewares=[self.middleware])
+        app.router.add_get("/", self.root)
+        app.router.add_get("/profile/borrowings/current", self.borrowings)
+        app.router.add_get("/profile/personal-data", self.personal_data)
+        app.router.add_post("/process-login", self.login)
+        app.router.add_post("/profile/renew-all", self.renew_all)
+        app.router.add_post("/profile/renew", self.renew)
+        app.router.add_get("/_stats", self.stats_view)
+        return app
+
+
+async def async_start(
+    simulator: Simulator, host: str = "127.0.0.1", port: int = 0
+) -> tuple[web.AppRunner, str]:
+    """Start simulator, return its runner and url."""
+    runner = web.AppRunner(simulator.application(), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner, f"http://{host}:{runner.addresses[0][1]}/"
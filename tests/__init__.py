@@ -0,0 +1 @@
+"""Tests of tritius integration."""
@@ -0,0 +1,9 @@
+"""Fixtures of tritius tests."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# tests import integration as package tritius, same as scripts/benchmark
+sys.path.append(str(Path(__file__).parents[1] / "custom_components"))
@@ -0,0 +1,134 @@
+"""Tests of tritius api client helpers."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+from bs4 import BeautifulSoup
+from tritius.api import (
+    TritiusBorrowing,
+    TritiusBorrowingChanges,
+    TritiusBorrowings,
+    TritiusUnknownStructureError,
+    _encoding,
+    _renew_forms,
+)
+
+DAY = date(2026, 10, 17)
+
+_RENEW_PAGE = """<div id="borrowings-portlet"><div class="portlet-content"><table><tbody><tr>
+<td><form{} method="post"><input type="hidden" name="id" value="7"></form></td>
+</tr></tbody></table></div></div>"""
+
+
+@pytest.mark.parametrize(
+    ("charset", "body", "expected"),
+    [
+        ("windows-1250", b"<meta charset='utf-8'>", "cp1250"),
+        (None, b"<head><meta charset=windows-1250></head>", "cp1250"),
+        (
+            None,
+            b'<meta http-equiv="Content-Type" content="text/html; charset=ISO-8859-2">',
+            "iso8859-2",
+        ),
+        (None, b"<head></head>", "utf-8"),
+        ("unknown", b"", "utf-8"),
+        (None, b" " * 1024 + b"<meta charset='windows-1250'>", "utf-8"),
+    ],
+)
+def test_encoding(charset: str | None, body: bytes, expected: str) -> None:
+    """Encoding is taken from header, then from meta tag of page."""
+    assert _encoding(charset, body) == expected
+
+
+@pytest.mark.parametrize(
+    ("page_url", "action", "expected"),
+    [
+        (
+            "https://knihovna.example/katalog/profile/borrowings/current",
+            "/katalog/profile/renew",
+            "https://knihovna.example/katalog/profile/renew",
+        ),
+        (
+            "https://knihovna.example/katalog/profile/borrowings/current?page=2",
+            "renew",
+            "https://knihovna.example/katalog/profile/borrowings/renew",
+        ),
+    ],
+)
+def test_renew_forms_action(page_url: str, action: str, expected: str) -> None:
+    """Action of renewal form is resolved against url of page."""
+    html = BeautifulSoup(_RENEW_PAGE.format(f' action="{action}"'), "html.parser")
+
+    assert _renew_forms(html, page_url) == {7: (expected, {"id": "7"})}
+
+
+def test_renew_forms_without_action() -> None:
+    """Renewal form without action is unknown structure."""
+    html = BeautifulSoup(_RENEW_PAGE.format(""), "html.parser")
+
+    with pytest.raises(TritiusUnknownStructureError):
+        _renew_forms(html, "https://knihovna.example/")
+
+
+def _borrowing(borrowing_id: int, days: int) -> TritiusBorrowing:
+    """Borrowing expiring days after day."""
+    return TritiusBorrowing(
+        author="Autor",
+        title=f"Kniha {borrowing_id}",
+        id=borrowing_id,
+        expiration=DAY + timedelta(days=days),
+    )
+
+
+def test_changes() -> None:
+    """Borrowings are matched by id, only extended expiration is renewal."""
+    previous = TritiusBorrowings(
+        [_borrowing(1, 1), _borrowing(2, 2), _borrowing(3, 3), _borrowing(4, 4)]
+    )
+    current = TritiusBorrowings(
+        [_borrowing(1, 15), _borrowing(2, 2), _borrowing(4, 1), _borrowing(5, 30)]
+    )
+
+    assert current.changes(previous) == TritiusBorrowingChanges(
+        added=(_borrowing(5, 30),),
+        removed=(_borrowing(3, 3),),
+        renewed=((_borrowing(1, 1), _borrowing(1, 15)),),
+    )
+
+
+def test_changes_unchanged() -> None:
+    """Equal or same borrowings have no changes."""
+    borrowings = TritiusBorrowings([_borrowing(1, 1), _borrowing(2, 2)])
+
+    assert not borrowings.changes(borrowings)
+    assert not borrowings.changes(TritiusBorrowings(reversed(borrowings)))
+    assert TritiusBorrowings().changes(borrowings) == TritiusBorrowingChanges(
+        removed=tuple(borrowings)
+    )
+
+
+def test_borrowings_order() -> None:
+    """Borrowings are sorted by expiration and title, indexed by id."""
+    borrowings = TritiusBorrowings(
+        [_borrowing(2, 5), _borrowing(3, 1), _borrowing(1, 5)]
+    )
+
+    assert [x.id for x in borrowings] == [3, 1, 2]
+    assert borrowings.nearest_expiration == DAY + timedelta(days=1)
+    assert borrowings.get(2) == _borrowing(2, 5)
+    assert borrowings.get(4) is None
+    assert TritiusBorrowings().nearest_expiration is None
+
+
+@pytest.mark.parametrize(
+    ("days", "expected"), [(0, []), (1, [3]), (4, [3]), (5, [3, 1, 2]), (9, [3, 1, 2])]
+)
+def test_expiring(days: int, expected: list[int]) -> None:
+    """Borrowings expiring on day are included."""
+    borrowings = TritiusBorrowings(
+        [_borrowing(2, 5), _borrowing(3, 1), _borrowing(1, 5)]
+    )
+
+    assert [x.id for x in borrowings.expiring(DAY + timedelta(days=days))] == expected
@@ -0,0 +1,66 @@
+"""Tests of tritius update coordinator."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+from homeassistant.util import dt as dt_util
+from tritius.coordinator import TritiusCoordinatorData, TritiusDataUpdateCoordinator
+
+TIME_ZONE = ZoneInfo("Europe/Prague")
+# evening of local day, alert of borrowings expiring in two days starts at midnight
+NOW = datetime(2026, 10, 17, 20, 0, tzinfo=TIME_ZONE)
+
+
+@pytest.fixture
+def coordinator(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[TritiusDataUpdateCoordinator]:
+    """Coordinator with default intervals at local time of Home Assistant."""
+    default_time_zone = dt_util.get_default_time_zone()
+    dt_util.set_default_time_zone(TIME_ZONE)
+    monkeypatch.setattr(dt_util, "now", lambda time_zone=None: NOW)
+    yield TritiusDataUpdateCoordinator(MagicMock(), MagicMock())
+    dt_util.set_default_time_zone(default_time_zone)
+
+
+@pytest.mark.parametrize(
+    ("expiration", "expected"),
+    [
+        (None, timedelta(hours=12)),
+        (date(2026, 10, 18), timedelta(hours=1)),
+        (date(2026, 10, 17), timedelta(hours=1)),
+        (date(2026, 10, 19), timedelta(hours=4, minutes=1)),
+        (date(2026, 10, 30), timedelta(hours=12)),
+    ],
+)
+def test_next_update_interval(
+    coordinator: TritiusDataUpdateCoordinator,
+    expiration: date | None,
+    expected: timedelta,
+) -> None:
+    """Update at midnight when alert starts, bounded by min and max interval."""
+    data = TritiusCoordinatorData(
+        user=None, borrowings=None, borrowing_expiration=expiration
+    )
+
+    assert coordinator._next_update_interval(data) == expected  # noqa: SLF001
+
+
+@pytest.mark.usefixtures("coordinator")
+@pytest.mark.parametrize(
+    ("expiration", "expected"),
+    [(date(2026, 10, 18), True), (date(2026, 10, 19), False), (None, False)],
+)
+def test_borrowing_alert(expiration: date | None, expected: bool) -> None:
+    """Alert is on from day before expiration in time zone of Home Assistant."""
+    data = TritiusCoordinatorData(
+        user=None, borrowings=None, borrowing_expiration=expiration
+    )
+
+    assert data.day == NOW.date()
+    assert data.has_borrowing_alert() is expected
@@ -0,0 +1,159 @@
+"""Parity of extraction across parser backends and strained parsing."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from bs4 import BeautifulSoup
+from tritius import parser
+from tritius.api import _extract_borrowings_page, _extract_user, _renew_forms
+from tritius.const import Selector
+from tritius.parser import _extract_subtree, content_digest
+
+from benchmarks import pages
+
+URL = "https://knihovna.example/"
+
+
+@pytest.fixture(params=["html.parser", "lxml"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Force tree builder used by parse_html."""
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    monkeypatch.setattr(parser, "parser_backend", lambda: request.param)
+    return request.param
+
+
+def _reference(text: str) -> BeautifulSoup:
+    """Whole page parsed by builtin parser."""
+    return BeautifulSoup(text, "html.parser")
+
+
+@pytest.mark.parametrize("count", pages.ACCOUNTS.values())
+@pytest.mark.parametrize("only", [(), (Selector.PORTLET_BORROWINGS,)])
+def test_borrowings(backend: str, count: int, only: tuple[Selector, ...]) -> None:
+    """Borrowings are same as extracted from whole page by builtin parser."""
+    text = pages.borrowings_page(count, extensions={1000: 3})
+    rows, page_count = _extract_borrowings_page(parser.parse_html(text, only))
+
+    assert (rows, page_count) == _extract_borrowings_page(_reference(text))
+    assert len(rows) == count
+    assert page_count == 1
+
+
+@pytest.mark.parametrize("page", [1, 3])
+def test_borrowings_pages(backend: str, page: int) -> None:
+    """Rows of one page and count of pages are extracted from strained page."""
+    text = pages.borrowings_page(250, page=page, page_size=100)
+    html = parser.parse_html(text, (Selector.PORTLET_BORROWINGS,))
+
+    assert _extract_borrowings_page(html) == _extract_borrowings_page(_reference(text))
+    assert _extract_borrowings_page(html)[1] == 3
+    url = f"{URL}profile/borrowings/current?page={page}"
+    assert _renew_forms(html, url) == _renew_forms(_reference(text), url)
+
+
+@pytest.mark.parametrize(
+    "only",
+    [(), (Selector.PORTLET_PERSONAL_DATA, Selector.REGISTRATION_EXPIRATION)],
+)
+def test_user(backend: str, only: tuple[Selector, ...]) -> None:
+    """User is same as extracted from whole page by builtin parser."""
+    text = pages.personal_data_page()
+    user = _extract_user(URL, parser.parse_html(text, only))
+
+    assert user == _extract_user(URL, _reference(text))
+    assert (user.id, user.name, user.surname) == ("31500000123", "Jana", "Nováková")
+
+
+@pytest.mark.parametrize(
+    ("text", "selector", "found"),
+    [
+        (pages.login_page(), Selector.LOGIN_FORM, True),
+        (pages.borrowings_page(2), Selector.LOGIN_FORM, False),
+        (
+            pages.borrowings_page(2, alert="Nelze prodloužit"),
+            Selector.FLASH_ALERT,
+            True,
+        ),
+        (pages.borrowings_page(2), Selector.FLASH_ALERT, False),
+        (pages.borrowings_page(2), Selector.RENEW_ALL_FORM, True),
+    ],
+)
+def test_find_in_html(backend: str, text: str, selector: Selector, found: bool) -> None:
+    """Elements are found in strained page same as in whole page."""
+    element = parser.find_in_html(text, selector)
+
+    assert (element is not None) == found
+    reference = _reference(text).select_one(selector)
+    assert (element and element.text) == (reference and reference.text)
+
+
+@pytest.mark.parametrize(
+    ("text", "found"), [(pages.login_page(), True), (pages.borrowings_page(2), False)]
+)
+def test_async_find_in_html(text: str, found: bool) -> None:
+    """Element is found by parsing in parse executor."""
+    element = asyncio.run(parser.async_find_in_html(text, Selector.LOGIN_FORM))
+
+    assert (element is not None) == found
+
+
+@pytest.mark.parametrize(
+    "inner",
+    [
+        "<!-- </div> -->",
+        "<script>document.write('</div>');</script>",
+        '<a title="</div>">odkaz</a>',
+        "<div><div></div></div>",
+    ],
+)
+def test_subtree_not_ended_early(inner: str) -> None:
+    """Comments, scripts and attributes do not end subtree, rows are digested."""
+    page = '<body><div id="borrowings-portlet">{}<p>{}</p></div></body>'
+
+    subtree = _extract_subtree(page.format(inner, "A"), "borrowings-portlet")
+
+    assert subtree == f'<div id="borrowings-portlet">{inner}<p>A</p></div>'
+    assert content_digest(
+        page.format(inner, "A"), (Selector.PORTLET_BORROWINGS,)
+    ) != content_digest(page.format(inner, "B"), (Selector.PORTLET_BORROWINGS,))
+
+
+@pytest.mark.parametrize(
+    "page",
+    [
+        '<div id="borrowings-portlet"><div><p>A</p></div>',
+        '<!-- <div id="borrowings-portlet"></div> --><p>A</p>',
+        "<div><p>A</p></div>",
+    ],
+)
+def test_subtree_missing(page: str) -> None:
+    """Unclosed or missing subtree has no digest, page is always extracted."""
+    assert _extract_subtree(page, "borrowings-portlet") is None
+    assert content_digest(page, (Selector.PORTLET_BORROWINGS,)) is None
+
+
+def test_subtree_of_page() -> None:
+    """Subtree of multiline fixture page ends with end tag of portlet."""
+    text = pages.borrowings_page(12)
+    subtree = _extract_subtree(text, "borrowings-portlet")
+
+    assert subtree is not None
+    assert subtree.startswith('<div id="borrowings-portlet"')
+    assert subtree.endswith("</div>")
+    assert _extract_borrowings_page(parser.parse_html(subtree)) == (
+        _extract_borrowings_page(_reference(text))
+    )
+
+
+def test_parse_executor_restarts_after_shutdown() -> None:
+    """Shut down executor starts threads again on next parsing."""
+    executor = parser.TritiusParseExecutor(workers=1)
+    text = pages.login_page()
+
+    assert asyncio.run(executor.async_run(len, text)) == len(text)
+    executor.shutdown()
+    assert asyncio.run(executor.async_run(len, text)) == len(text)
+    executor.shutdown()